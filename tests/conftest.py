@@ -0,0 +1,4 @@
+import matplotlib
+
+# Tests render off-screen
+matplotlib.use("Agg")
@@ -0,0 +1,43 @@
+from wbpyplot import render_many, wb_plot
+
+
+def plot_line(axs, values):
+    axs[0].plot(range(len(values)), values, label="Series")
+
+
+@wb_plot(title="Decorated", width=600, height=400)
+def plot_decorated(axs):
+    axs[0].bar(["a", "b"], [1, 2])
+
+
+def plot_broken(axs):
+    raise ValueError("no data for this country")
+
+
+def test_render_many_in_pool_reports_each_job(tmp_path):
+    jobs = [
+        {"func": plot_line, "args": ([1, 3, 2],), "save_path": tmp_path / "line.png"},
+        (plot_broken, (), {}, tmp_path / "broken.png"),
+        (plot_decorated, (), {"title": "Override"}, tmp_path / "bar.png"),
+    ]
+
+    results = render_many(jobs, workers=2)
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert [r.ok for r in results] == [True, False, True]
+    assert "ValueError: no data for this country" in results[1].error
+    assert (tmp_path / "line.png").stat().st_size > 0
+    assert (tmp_path / "bar.png").stat().st_size > 0
+    assert not (tmp_path / "broken.png").exists()
+
+
+def test_render_many_serial_collects_reports(tmp_path):
+    results = render_many(
+        [(plot_line, ([1, 2],), {"profile": True}, tmp_path / "a.png")],
+        workers=1,
+    )
+
+    (result,) = results
+    assert result.ok and result.error is None
+    assert result.save_path == tmp_path / "a.png"
+    assert result.report is not None and result.report.draw_count >= 1
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+from matplotlib import colormaps
+from matplotlib.figure import Figure
+
+from wbpyplot import colors, wb_plot
+from wbpyplot.colors import (
+    EXACT_QUANTILE_LIMIT,
+    build_binned_cmap_and_norm_from_axes,
+    register_palette,
+    resolve_color_cycle_and_label_map,
+)
+
+
+def _raster_axes(data):
+    ax = Figure().add_subplot()
+    ax.imshow(data)
+    return ax
+
+
+def _quantile_edges(data, bins):
+    _, norm = build_binned_cmap_and_norm_from_axes([_raster_axes(data)], colormaps["viridis"], bins, mode="quantile")
+    return norm.boundaries
+
+
+def test_streamed_quantiles_match_exact_on_heavy_tails():
+    # Lognormal values span many orders of magnitude: nearly all of them sit
+    # in the lowest sliver of the value range
+    rng = np.random.default_rng(0)
+    data = rng.lognormal(sigma=3.0, size=(1_200, 1_000))
+    data[rng.random(data.shape) < 0.01] = np.nan
+    assert np.isfinite(data).sum() > EXACT_QUANTILE_LIMIT
+
+    edges = _quantile_edges(data, 7)
+
+    expected = np.quantile(data[np.isfinite(data)], np.linspace(0, 1, 8))
+    np.testing.assert_array_equal(edges, expected)
+
+
+def test_streamed_quantiles_match_exact_on_repeated_values(monkeypatch):
+    monkeypatch.setattr(colors, "EXACT_QUANTILE_LIMIT", 10_000)
+    monkeypatch.setattr(colors, "QUANTILE_COLLECT_LIMIT", 500)
+    rng = np.random.default_rng(1)
+    data = rng.integers(0, 5, size=(300, 300)).astype(float)
+
+    edges = _quantile_edges(data, 6)
+
+    np.testing.assert_array_equal(edges, np.quantile(data, np.linspace(0, 1, 7)))
+
+
+def test_streamed_quantiles_stay_within_rank_error(monkeypatch):
+    # A search stops once the range left holds no more than quantile_error
+    # of the values and interpolates within it
+    monkeypatch.setattr(colors, "EXACT_QUANTILE_LIMIT", 10_000)
+    monkeypatch.setattr(colors, "QUANTILE_COLLECT_LIMIT", 100)
+    rng = np.random.default_rng(2)
+    data = rng.lognormal(sigma=3.0, size=(400, 400))
+    qs = np.linspace(0, 1, 6)
+    quantile_error = 0.05
+
+    _, norm = build_binned_cmap_and_norm_from_axes(
+        [_raster_axes(data)], colormaps["viridis"], 5, mode="quantile", quantile_error=quantile_error
+    )
+
+    values = np.sort(data.ravel())
+    ranks = np.searchsorted(values, norm.boundaries) / (values.size - 1)
+    assert np.all(np.abs(ranks - qs) <= quantile_error)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    # Palettes registered by a test are dropped afterwards
+    monkeypatch.setattr(colors, "PALETTES", dict(colors.PALETTES))
+    monkeypatch.setattr(colors, "COMPANION_TEXT_ALIASES", dict(colors.COMPANION_TEXT_ALIASES))
+    monkeypatch.setattr(colors, "_compiled_palettes", {})
+    colors._palette_cycler.cache_clear()
+    yield
+    colors._palette_cycler.cache_clear()
+
+
+def test_register_palette_cycles_colors_in_charts(registry):
+    register_palette("brand", ["#112233", "#445566", "#778899"])
+
+    lines = []
+
+    @wb_plot(palette="brand", palette_n=2, pyplot=False, show=False)
+    def chart(axs):
+        for i in range(3):
+            lines.extend(axs[0].plot([0, 1], [i, i + 1]))
+
+    with chart():
+        assert [line.get_color() for line in lines] == ["#112233", "#445566", "#112233"]
+
+
+def test_register_sequential_palette_builds_colormap_and_colorscale(registry):
+    compiled = register_palette("brand_seq", ["#ffffff", "#000000"])
+
+    assert compiled.kind == "sequence" and compiled.cmap is not None
+    np.testing.assert_allclose(compiled.cmap(1.0), (0, 0, 0, 1))
+    assert compiled.colorscale == ((0.0, "#ffffff"), (1.0, "#000000"))
+
+
+def test_register_label_map_with_text_colors(registry):
+    register_palette("brand_regions", {"North": "#112233", "South": "#445566"}, text_colors={"North": "#000000"})
+
+    cycle, label_map, text_map, cmap = resolve_color_cycle_and_label_map("brand_regions")
+
+    assert cycle is None and cmap is None
+    assert dict(label_map) == {"North": "#112233", "South": "#445566"}
+    assert dict(text_map) == {"North": "#000000"}
+
+
+def test_reregistering_replaces_the_compiled_palette(registry):
+    register_palette("brand", ["#112233", "#445566"])
+    first = resolve_color_cycle_and_label_map("brand")[0]
+    register_palette("brand", ["#aabbcc"])
+
+    cycle = resolve_color_cycle_and_label_map("brand")[0]
+
+    assert [c["color"] for c in first] == ["#112233", "#445566"]
+    assert [c["color"] for c in cycle] == ["#aabbcc"]
+
+
+@pytest.mark.parametrize("bad", [["red", "blue"], [], {"North": "navy"}])
+def test_register_palette_rejects_non_hex_colors(registry, bad):
+    with pytest.raises(ValueError, match="hex colors"):
+        register_palette("broken", bad)
+    assert "broken" not in colors.PALETTES
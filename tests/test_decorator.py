@@ -0,0 +1,44 @@
+import gc
+import weakref
+
+import matplotlib.pyplot as plt
+
+from wbpyplot import FigureScope, wb_plot
+
+
+def _chart(**options):
+    figures = []
+
+    @wb_plot(title="GDP", pyplot=False, **options)
+    def chart(fig, axs):
+        figures.append(weakref.ref(fig))
+        axs[0].plot([2020, 2021, 2022], [1.0, 2.0, 1.5], label="World")
+
+    return chart, figures
+
+
+def test_saved_render_without_show_leaves_no_live_figure(tmp_path):
+    open_before = plt.get_fignums()
+    chart, figures = _chart(save_path=tmp_path / "gdp.png", show=False)
+
+    assert chart() is None
+    gc.collect()
+
+    assert (tmp_path / "gdp.png").stat().st_size > 0
+    assert figures[0]() is None
+    assert plt.get_fignums() == open_before
+
+
+def test_figure_scope_releases_figure_on_exit():
+    open_before = plt.get_fignums()
+    chart, figures = _chart(show=False)
+
+    scope = chart()
+    assert isinstance(scope, FigureScope)
+    with scope as (fig, axs):
+        assert fig is figures[0]() and len(fig.axes) == 1
+        # Never registered with pyplot
+        assert plt.get_fignums() == open_before
+    assert scope.fig is None
+    assert fig.axes == [] and fig.texts == []
+    scope.close()
@@ -0,0 +1,59 @@
+import numpy as np
+from matplotlib.collections import PathCollection, PolyCollection
+from matplotlib.figure import Figure
+
+from wbpyplot import wb_plot
+from wbpyplot.density import aggregate_dense_scatters, density_threshold
+
+
+def _points(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=n), rng.normal(size=n)
+
+
+def test_density_threshold():
+    assert density_threshold(False) is None
+    assert density_threshold(True) == 100_000
+    assert density_threshold(5_000) == 5_000
+
+
+def test_large_scatter_becomes_hexbin_with_its_label():
+    x, y = _points(20_000)
+
+    @wb_plot(title="Income", scatter_density=10_000, pyplot=False, show=False)
+    def chart(axs):
+        axs[0].scatter(x, y, label="Households")
+        axs[0].scatter([0, 1], [0, 1], label="Cities")
+
+    with chart() as (fig, axs):
+        hexbin, cities = list(axs[0].collections)
+        assert type(hexbin) is PolyCollection
+        assert hexbin.get_label() == "Households"
+        # Every point is counted in some cell
+        assert hexbin.get_array().sum() == len(x)
+        assert isinstance(cities, PathCollection) and len(cities.get_offsets()) == 2
+
+
+def test_color_mapped_scatter_keeps_norm_and_colorbar():
+    x, y = _points(3_000)
+    fig = Figure()
+    ax = fig.subplots()
+    scatter = ax.scatter(x, y, c=x + y, cmap="viridis", vmin=-3, vmax=3)
+    colorbar = fig.colorbar(scatter, ax=ax)
+
+    (hexbin,) = aggregate_dense_scatters([ax], 1_000)
+
+    assert list(ax.collections) == [hexbin]
+    assert hexbin.norm is scatter.norm and hexbin.get_cmap().name == "viridis"
+    # Mean value per cell stays within the data range
+    assert np.nanmax(np.abs(hexbin.get_array())) <= np.abs(x + y).max()
+    assert hexbin.colorbar is colorbar and colorbar.mappable is hexbin
+
+
+def test_small_scatters_are_kept():
+    x, y = _points(500)
+    ax = Figure().subplots()
+    scatter = ax.scatter(x, y)
+
+    assert aggregate_dense_scatters([ax], 1_000) == []
+    assert list(ax.collections) == [scatter]
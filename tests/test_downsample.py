@@ -0,0 +1,60 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+from wbpyplot.downsample import downsample_lines, downsample_rasters, lttb_indices
+
+
+def _series(n=100_000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n, dtype=float)
+    y = rng.normal(size=n).cumsum()
+    # Isolated spikes a bucket average would smooth away
+    y[12_345] += 500
+    y[87_654] -= 500
+    return x, y
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    x, y = _series()
+    idx = lttb_indices(x, y, 1_000)
+
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+    assert np.all(np.diff(idx) > 0)
+    assert len(idx) <= 1_000 + 2
+    assert y[idx].max() == y.max()
+    assert y[idx].min() == y.min()
+
+
+def test_lttb_returns_everything_when_short():
+    x, y = np.arange(50.0), np.sin(np.arange(50.0))
+    np.testing.assert_array_equal(lttb_indices(x, y, 100), np.arange(50))
+
+
+def test_downsample_lines_reduces_lines_but_not_markers():
+    x, y = _series(200_000)
+    fig = Figure(figsize=(8, 4), dpi=100)
+    ax = fig.subplots()
+    line = ax.plot(x, y)[0]
+    markers = ax.plot(x, y, "o")[0]
+
+    assert downsample_lines([ax], True) == 1
+    assert len(line.get_xdata()) < 5_000
+    assert line.get_ydata().max() == y.max() and line.get_ydata().min() == y.min()
+    assert len(markers.get_xdata()) == len(x)
+
+
+def test_downsample_rasters_keeps_most_common_category():
+    # 4 x 4 blocks of categories where the first cell is the odd one out
+    blocks = np.arange(25 * 25).reshape(25, 25) % 7
+    categories = np.kron(blocks, np.ones((4, 4), dtype=int))
+    categories[::4, ::4] = 99
+    rgb = np.zeros(categories.shape + (3,), dtype=np.uint8)
+    rgb[::4, ::4] = 255
+    ax, ax_rgb = Figure().subplots(1, 2)
+    im = ax.imshow(categories)
+    im_rgb = ax_rgb.imshow(rgb)
+
+    assert downsample_rasters([ax, ax_rgb], 25) == 2
+    np.testing.assert_array_equal(im.get_array(), blocks)
+    # RGB images are sampled, not voted per channel
+    np.testing.assert_array_equal(im_rgb.get_array(), np.full((25, 25, 3), 255, dtype=np.uint8))
@@ -0,0 +1,19 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+from wbpyplot.export import RASTERIZE_THRESHOLD, rasterize_heavy_artists
+
+
+def test_heavy_contours_and_fills_are_rasterized():
+    x = np.linspace(0, 10, 1_500)
+    z = np.sin(x)[:, None] * np.cos(x)
+    fig = Figure()
+    ax_contour, ax_fill = fig.subplots(1, 2)
+    contours = ax_contour.contourf(z, levels=10)
+    fill = ax_fill.fill_between(np.arange(RASTERIZE_THRESHOLD), np.sin(np.arange(RASTERIZE_THRESHOLD)))
+    small = ax_fill.fill_between([0, 1, 2], [1, 2, 1])
+    scatter = ax_fill.scatter(np.arange(RASTERIZE_THRESHOLD), np.arange(RASTERIZE_THRESHOLD))
+
+    assert rasterize_heavy_artists(fig, RASTERIZE_THRESHOLD) == 3
+    assert contours.get_rasterized() and fill.get_rasterized() and scatter.get_rasterized()
+    assert not small.get_rasterized()
@@ -0,0 +1,64 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+_PROBE = """
+import json, sys, time
+import matplotlib
+matplotlib.use("Agg")
+from wbpyplot import wb_plot
+from wbpyplot import theme
+from wbpyplot.layout import text_extent_cache_info
+
+def loaded():
+    return {
+        "figure": "matplotlib.figure" in sys.modules,
+        "agg": "matplotlib.backends.backend_agg" in sys.modules,
+        "extents": text_extent_cache_info().currsize,
+    }
+
+before = loaded()
+font_list = theme.warm_font_cache() if sys.argv[1] == "warm" else None
+after = loaded()
+
+@wb_plot(title="Growth", note="Source: WDI", pyplot=False, show=False)
+def chart(axs, i):
+    axs[0].plot([1, 2, 3], [i, 2, 1], label="World")
+
+timings = []
+for i in range(3):
+    start = time.perf_counter()
+    chart(i).close()
+    timings.append(time.perf_counter() - start)
+print(json.dumps({"before": before, "after": after, "font_list": font_list, "timings": timings}))
+"""
+
+
+def _probe(mode, tmp_path):
+    # Fresh interpreter and Matplotlib config dir, like a new container
+    root = Path(__file__).resolve().parents[1]
+    env = {"MPLCONFIGDIR": str(tmp_path / mode), "PATH": ""}
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, mode], capture_output=True, text=True, check=True, cwd=root, env=env
+    ).stdout
+    return json.loads(out)
+
+
+def test_warm_font_cache_loads_what_the_first_render_needs(tmp_path):
+    warm = _probe("warm", tmp_path)
+
+    assert warm["before"] == {"figure": False, "agg": False, "extents": 0}
+    assert warm["after"]["figure"] and warm["after"]["agg"]
+    assert warm["after"]["extents"] > 0
+    assert Path(warm["font_list"]).is_file()
+
+
+def test_first_render_after_warming_is_close_to_later_ones(tmp_path):
+    cold = _probe("cold", tmp_path)
+    warm = _probe("warm", tmp_path)
+
+    # Cold processes pay for imports and fonts in the first chart; warmed
+    # ones already did
+    assert cold["timings"][0] > 1.5 * min(cold["timings"][1:])
+    assert warm["timings"][0] < 1.5 * min(warm["timings"][1:])
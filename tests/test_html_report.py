@@ -0,0 +1,65 @@
+import json
+import re
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.io.json import to_json_plotly
+
+from wbpyplot import write_html_report
+from wbpyplot.export import _REF_KEY
+
+
+def _page_data(path):
+    html = path.read_text(encoding="utf-8")
+    arrays = json.loads(re.search(r"var arrays = (.*);\n", html).group(1))
+    figures = json.loads(re.search(r"var figures = (.*);\n", html).group(1))
+    return html, arrays, figures
+
+
+def _resolve(node, arrays):
+    # What the page script does before Plotly.newPlot
+    if isinstance(node, list):
+        return [_resolve(value, arrays) for value in node]
+    if isinstance(node, dict):
+        if _REF_KEY in node:
+            return arrays[node[_REF_KEY]]
+        return {key: _resolve(value, arrays) for key, value in node.items()}
+    return node
+
+
+def _figures():
+    years = list(range(2000, 2024))
+    rng = np.random.default_rng(0)
+    return [
+        go.Figure(go.Scatter(x=years, y=rng.normal(size=24), name="GDP")),
+        go.Figure(go.Bar(x=years, y=np.arange(24.0), name="Population")),
+        go.Figure(go.Scatter(x=[1, 2], y=[3, 4])),
+    ]
+
+
+def test_report_round_trips_every_figure(tmp_path):
+    figs = _figures()
+    path = tmp_path / "report.html"
+
+    write_html_report(figs, path, title="Country <dashboard>")
+
+    html, arrays, figures = _page_data(path)
+    assert "<title>Country &lt;dashboard&gt;</title>" in html
+    assert html.count('class="wb-chart"') == 3
+    for fig, stored in zip(figs, figures):
+        assert _resolve(stored, arrays) == json.loads(to_json_plotly(fig.to_plotly_json()))
+
+
+def test_report_stores_shared_arrays_once(tmp_path):
+    path = tmp_path / "report.html"
+
+    write_html_report(_figures(), path)
+
+    _, arrays, figures = _page_data(path)
+    years = list(range(2000, 2024))
+    # The years of both charts and the shared template are stored once
+    assert arrays.count(years) == 1
+    assert figures[0]["data"][0]["x"] == figures[1]["data"][0]["x"]
+    assert figures[0]["layout"]["template"] == figures[1]["layout"]["template"]
+    # Short arrays are kept in place
+    assert figures[2]["data"][0]["x"] == [1, 2]
@@ -0,0 +1,25 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from wbpyplot.cli import HEAVY_MODULES
+
+_PROBE = """
+import json, sys
+import wbpyplot
+from wbpyplot import wb_plot, render_many, write_html_report, FigureScope
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def test_import_does_not_load_plotting_libraries():
+    # Fresh interpreter: this test process has already imported everything
+    root = Path(__file__).resolve().parents[1]
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True, cwd=root
+    ).stdout
+    loaded = set(json.loads(out))
+
+    for module in ("matplotlib", "plotly", "pandas", "shapely") + HEAVY_MODULES:
+        assert module not in loaded, f"import wbpyplot loaded {module}"
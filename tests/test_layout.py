@@ -0,0 +1,29 @@
+from wbpyplot import wb_plot
+from wbpyplot.layout import _layout_cache, clear_layout_cache
+
+
+def _render(path):
+    @wb_plot(
+        title="GDP growth",
+        subtitle="Annual %",
+        note="Source: World Bank",
+        save_path=path,
+        pyplot=False,
+    )
+    def chart(axs):
+        axs[0].plot([2020, 2021, 2022], [1.5, 3.2, 2.1], label="World")
+        axs[0].plot([2020, 2021, 2022], [0.5, 2.2, 1.8], label="LAC")
+
+    chart()
+
+
+def test_layout_cache_hit_renders_identical_output(tmp_path):
+    clear_layout_cache()
+    miss, hit = tmp_path / "miss.png", tmp_path / "hit.png"
+
+    _render(miss)
+    assert len(_layout_cache) == 1
+    _render(hit)
+    assert len(_layout_cache) == 1
+
+    assert miss.read_bytes() == hit.read_bytes()
@@ -0,0 +1,43 @@
+import matplotlib
+import numpy as np
+
+from wbpyplot import wb_plot
+
+
+def _text_style(text):
+    return text.get_fontfamily(), text.get_fontsize(), text.get_fontweight(), text.get_color()
+
+
+def test_update_keeps_bar_label_style():
+    @wb_plot(title="Exports", live=True, show=False)
+    def chart(axs):
+        axs[0].bar(["Kenya", "Peru", "Chile"], [3, 4, 5])
+
+    live = chart()
+    with live as (fig, (ax,)):
+        before = [_text_style(text) for text in live.decorations[ax].bar_labels]
+        family = matplotlib.rcParams["font.family"]
+
+        live.update({0: [30, 40, 50]})
+
+        labels = live.decorations[ax].bar_labels
+        assert [text.get_text() for text in labels] == ["30", "40", "50"]
+        assert [_text_style(text) for text in labels] == before
+        assert before[0][0] != family
+        # Tick labels created for the new limits are themed too
+        assert {tick.label1.get_fontfamily()[0] for tick in ax.yaxis.get_major_ticks()} == {before[0][0][0]}
+
+
+def test_update_replaces_line_data_and_rescales():
+    @wb_plot(title="Prices", live=True, show=False)
+    def chart(axs):
+        axs[0].plot([2020, 2021, 2022], [1, 2, 3], label="Brent")
+
+    live = chart()
+    with live as (fig, (ax,)):
+        (line,) = live.series()
+
+        live.update({"Brent": ([2020, 2021, 2022], [10, 20, 30])})
+
+        np.testing.assert_array_equal(line.get_ydata(), [10, 20, 30])
+        assert ax.get_ylim()[1] >= 30
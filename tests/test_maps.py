@@ -0,0 +1,128 @@
+import geopandas
+import pytest
+import shapely
+import shapely.geometry
+
+from wbpyplot import maps, wb_plot
+from wbpyplot.maps import clear_geometry_cache, prepare_map, simplify_geojson
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_geometry_cache()
+    yield
+    clear_geometry_cache()
+
+
+def _countries():
+    squares = [shapely.box(x, 0, x + 10, 10).segmentize(0.5) for x in range(-30, 30, 10)]
+    return geopandas.GeoDataFrame({"value": range(len(squares))}, geometry=squares, crs="EPSG:4326")
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    counts = {"hash": 0, "to_crs": 0, "simplify": 0}
+
+    def counted(name, function):
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(maps, "geometry_hash", counted("hash", maps.geometry_hash))
+    monkeypatch.setattr(maps, "_simplify", counted("simplify", maps._simplify))
+    monkeypatch.setattr(geopandas.GeoSeries, "to_crs", counted("to_crs", geopandas.GeoSeries.to_crs))
+    return counts
+
+
+def test_second_call_skips_hashing_reprojection_and_simplification(calls):
+    countries = _countries()
+
+    first = prepare_map(countries, crs="EPSG:8857", width=600)
+    second = prepare_map(countries, crs="EPSG:8857", width=600)
+
+    assert calls == {"hash": 1, "to_crs": 1, "simplify": 1}
+    assert second.geometry.values is not countries.geometry.values
+    assert list(second.geometry) == list(first.geometry)
+    assert countries.crs == "EPSG:4326"
+
+
+def test_equal_geometries_in_a_new_frame_share_the_cache(calls):
+    prepare_map(_countries(), crs="EPSG:8857", width=600)
+    prepare_map(_countries(), crs="EPSG:8857", width=600)
+
+    # The content is hashed again, but nothing is reprocessed
+    assert calls == {"hash": 2, "to_crs": 1, "simplify": 1}
+
+
+def test_replaced_geometry_is_rehashed(calls):
+    countries = _countries()
+    before = prepare_map(countries, crs="EPSG:8857", width=600)
+
+    geometries = countries.geometry.values
+    geometries[0] = shapely.box(100, 0, 110, 10)
+    after = prepare_map(countries, crs="EPSG:8857", width=600)
+
+    assert calls["hash"] == 2 and calls["to_crs"] == 2
+    assert after.geometry.iloc[0].bounds[0] > before.geometry.iloc[-1].bounds[2]
+
+
+def test_simplified_to_a_fraction_of_a_pixel():
+    countries = _countries()
+
+    prepared = prepare_map(countries, crs="EPSG:8857", width=600)
+
+    assert shapely.get_num_coordinates(prepared.geometry.values).sum() < shapely.get_num_coordinates(
+        countries.geometry.values
+    ).sum()
+    assert prepared.crs == "EPSG:8857"
+    assert all(shapely.is_valid(prepared.geometry.values))
+
+
+def _world_geojson():
+    world = shapely.box(-180, -60, 180, 80).segmentize(0.01)
+    island = shapely.box(10, 10, 10.04, 10.04)
+    features = [
+        {"type": "Feature", "id": "WLD", "properties": {"name": "World"}, "geometry": shapely.geometry.mapping(world)},
+        {"type": "Feature", "id": "ISL", "properties": {"name": "Island"}, "geometry": shapely.geometry.mapping(island)},
+    ]
+    return {"type": "FeatureCollection", "features": features}
+
+
+def test_simplify_geojson_reduces_and_rounds_coordinates():
+    geojson = _world_geojson()
+
+    simplified = simplify_geojson(geojson, width=1200)
+
+    world = shapely.geometry.shape(simplified["features"][0]["geometry"])
+    assert shapely.get_num_coordinates(world) < 10
+    assert world.equals(shapely.box(-180, -60, 180, 80))
+    assert [f["id"] for f in simplified["features"]] == ["WLD", "ISL"]
+    assert simplified["features"][1]["properties"] == {"name": "Island"}
+    # The input is left alone and repeat calls share the result
+    assert len(geojson["features"][0]["geometry"]["coordinates"][0]) > 10_000
+    assert simplify_geojson(_world_geojson(), width=1200) is simplified
+
+
+def test_simplify_geojson_keeps_features_smaller_than_the_grid():
+    # The island is well under the 0.1 degree grid the world is rounded to
+    simplified = simplify_geojson(_world_geojson(), width=1200)
+
+    island = shapely.geometry.shape(simplified["features"][1]["geometry"])
+    assert not island.is_empty and island.area > 0
+    assert shapely.box(10, 10, 10.04, 10.04).covers(island)
+
+
+def test_render_simplifies_choropleth_geojson():
+    import plotly.graph_objects as go
+
+    geojson = _world_geojson()
+
+    @wb_plot(backend="plotly", simplify_geojson=True, show=False)
+    def chart(fig):
+        fig.add_trace(go.Choropleth(geojson=geojson, locations=["WLD", "ISL"], z=[1, 2]))
+
+    features = chart().data[0].geojson["features"]
+    assert len(features[0]["geometry"]["coordinates"][0]) < 10
+    assert features[1]["geometry"]["coordinates"]
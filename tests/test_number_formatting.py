@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from wbpyplot.number_formatting import SPECIAL_UNITS, format_number, format_numbers
+
+EDGE_FLOATS = [
+    0.0, -0.0, 0.004, 0.005, 0.5, 1.0, 1.005, 9.995, 99.995, 999.95, 999.999, 1000.0, 1500.0,
+    2024.0, 9999.5, 99_999.0, 999_499.0, 999_500.0, 999_999.0, 1e6, 1.25e6, 999_999_999.0,
+    1e9, 1.5e12, 1e15, 2.0**53, 2.0**53 + 2, 1e300, -1.5, -999.95, -1.25e6, -2.5e9,
+    np.nan, np.inf, -np.inf,
+]
+EDGE_INTS = [0, 1, -1, 7, 999, 1000, 1999, 2100, 9999, 10_000, 999_999, 1_000_000,
+             -1_000_000, 123_456_789, 2**53 - 1, 2**53, 2**53 + 1, 2**62, -(2**62)]
+
+FLAGS = [
+    dict(),
+    dict(is_percent=True),
+    dict(is_currency=True),
+    *(dict(unit=unit) for unit in sorted(SPECIAL_UNITS)),
+    dict(unit="kg"),
+]
+
+
+def _random_floats(n=2_000, seed=0):
+    rng = np.random.default_rng(seed)
+    magnitudes = 10.0 ** rng.uniform(-3, 13, n)
+    values = np.where(rng.random(n) < 0.5, -1, 1) * magnitudes
+    # Round some to few decimals so exact ties and integers are covered
+    values[::3] = np.round(values[::3], 2)
+    values[1::3] = np.round(values[1::3])
+    return values
+
+
+@pytest.mark.parametrize("flags", FLAGS)
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array(EDGE_FLOATS),
+        np.array(EDGE_INTS, dtype=np.int64),
+        _random_floats(),
+        np.random.default_rng(1).integers(-(10**12), 10**12, 2_000),
+    ],
+    ids=["edge_floats", "edge_ints", "random_floats", "random_ints"],
+)
+def test_format_numbers_matches_format_number(values, flags):
+    expected = [format_number(v, **flags) for v in values.tolist()]
+    assert format_numbers(values, **flags).tolist() == expected
+
+
+def test_format_numbers_keeps_shape():
+    values = np.array([[1.0, 2500.0], [np.nan, 1.5e6]])
+    result = format_numbers(values)
+    assert result.shape == values.shape
+    assert result.tolist() == [[format_number(v) for v in row] for row in values.tolist()]
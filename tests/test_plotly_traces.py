@@ -0,0 +1,88 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from wbpyplot import wb_plot
+from wbpyplot.plotly_traces import classify_traces, style_traces
+
+
+def _style(fig, **options):
+    options.setdefault("text_font", {"family": "Open Sans", "size": 12})
+    style_traces(fig, classify_traces(fig), **options)
+    return fig
+
+
+def test_hover_formats_numbers_in_the_browser():
+    fig = go.Figure()
+    fig.add_scatter(x=np.array([2020, 2021]), y=np.array([1.234, 5.0]))
+    fig.add_bar(x=["Kenya", "Peru"], y=[3, 4])
+
+    _style(fig, x_title="Year", y_title="GDP")
+
+    line, bar = fig.data
+    assert line.hovertemplate == (
+        "Year: <b>%{x:.2~f}</b><br>" + "_" * 30 + "<br>GDP: <b>%{y:.2~f}</b><extra></extra>"
+    )
+    # Categories and dates are shown as given
+    assert "Year: <b>%{x}</b>" in bar.hovertemplate and "%{y:.2~f}" in bar.hovertemplate
+    # No per-point copy of the data
+    assert line.customdata is None and bar.customdata is None
+
+
+def test_hover_keeps_user_templates_and_customdata():
+    fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4], customdata=[["a"], ["b"]], hovertemplate="%{customdata[0]}"))
+
+    _style(fig)
+
+    assert fig.data[0].hovertemplate == "%{customdata[0]}"
+    assert [list(row) for row in fig.data[0].customdata] == [["a"], ["b"]]
+
+
+def test_render_sets_hover_titles_from_axes():
+    @wb_plot(title="Growth", backend="plotly", show=False)
+    def chart(fig):
+        fig.add_scatter(x=[2020, 2021, 2022], y=[1.5, 2.25, 3.0], mode="lines", name="World")
+        fig.update_xaxes(title_text="Year")
+
+    (trace,) = chart().data
+
+    assert trace.hovertemplate.startswith("Year: <b>%{x:.2~f}</b>")
+
+
+def test_classify_traces_in_one_pass():
+    fig = go.Figure()
+    fig.add_bar(y=["Kenya", "Peru"], x=[3, 4], orientation="h", name="GDP")
+    fig.add_scatter(x=[2020, 2021], y=[1, 2], mode="lines")
+
+    summary = classify_traces(fig)
+
+    assert summary.has_bar and summary.is_bar_horizontal and summary.has_legend
+    assert summary.first_bar is fig.data[0]
+    assert summary.is_line_chart_with_temporal_x and not summary.has_choropleth
+
+
+def test_style_traces_applies_wb_styling():
+    fig = go.Figure()
+    fig.add_bar(x=["a", "b", "c"], y=[1.0, 2.5, 1.0], name="Exports")
+    fig.add_scatter(x=[1, 2], y=[3, 4], mode="lines+markers", name="Imports")
+    fig.add_scatter(x=[1, 2], y=[3, 4], mode="lines", name="Other", line_width=4)
+    fig.add_heatmap(z=[[1, 2], [3, 4]])
+    colorscale = [[0, "#ffffff"], [1, "#000000"]]
+
+    _style(fig, colorscale=colorscale, label_map={"Imports": "#FF9800"})
+
+    bar, imports, other, heatmap = fig.data
+    assert list(bar.text) == ["1", "2.5", "1"] and bar.textposition == "outside"
+    assert bar.outsidetextfont.weight == "bold"
+    assert [t.name for t in (bar, imports, other)] == ["EXPORTS", "IMPORTS", "OTHER"]
+    assert imports.line.color == "#FF9800" and imports.marker.color == "#FF9800"
+    assert imports.line.width == 2.0 and other.line.width == 4
+    assert imports.marker.size == 8 and imports.marker.line.color == "white"
+    assert [list(stop) for stop in heatmap.colorscale] == colorscale
+
+
+def test_bar_labels_can_be_turned_off():
+    fig = go.Figure(go.Bar(x=["a", "b"], y=[1, 2]))
+
+    _style(fig, bar_labels=False)
+
+    assert fig.data[0].text is None
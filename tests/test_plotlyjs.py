@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from wbpyplot import wb_plot
+from wbpyplot.export import PLOTLYJS_FILENAME, plotlyjs_script_src
+
+
+def _chart(**options):
+    @wb_plot(title="GDP", backend="plotly", show=False, **options)
+    def chart(fig):
+        fig.add_scatter(x=[2020, 2021], y=[1, 2], name="World")
+
+    return chart
+
+
+def test_inline_embeds_the_bundle(tmp_path):
+    _chart(save_path=tmp_path / "gdp.html")()
+
+    html = (tmp_path / "gdp.html").read_text(encoding="utf-8")
+    assert "src=\"plotly.min.js\"" not in html and len(html) > 1_000_000
+
+
+def test_directory_shares_one_bundle(tmp_path):
+    for name in ("gdp.html", "pop.html"):
+        _chart(save_path=tmp_path / name, plotlyjs="directory")()
+
+    bundle = tmp_path / PLOTLYJS_FILENAME
+    assert bundle.stat().st_size > 1_000_000
+    for name in ("gdp.html", "pop.html"):
+        html = (tmp_path / name).read_text(encoding="utf-8")
+        assert 'src="plotly.min.js"' in html and len(html) < 100_000
+
+
+def test_js_path_is_referenced_relative_to_the_html(tmp_path, monkeypatch):
+    # Relative bundle paths are resolved against the working directory
+    monkeypatch.chdir(tmp_path)
+    html_path = tmp_path / "charts" / "gdp.html"
+    os.makedirs(html_path.parent)
+
+    _chart(save_path=html_path, plotlyjs="assets/plotly.min.js")()
+
+    assert (tmp_path / "assets" / "plotly.min.js").is_file()
+    assert 'src="../assets/plotly.min.js"' in html_path.read_text(encoding="utf-8")
+
+
+def test_existing_bundle_is_reused(tmp_path):
+    bundle = tmp_path / "plotly.min.js"
+    bundle.write_text("// pinned", encoding="utf-8")
+
+    assert plotlyjs_script_src(bundle, tmp_path / "gdp.html") == "plotly.min.js"
+    assert bundle.read_text(encoding="utf-8") == "// pinned"
+
+
+@pytest.mark.parametrize("plotlyjs", [True, None, 3, "cdn", "bundle.min.css"])
+def test_unknown_values_raise_value_error(tmp_path, plotlyjs):
+    with pytest.raises(ValueError, match="Unknown plotlyjs"):
+        plotlyjs_script_src(plotlyjs, tmp_path / "gdp.html")
+
+
+def test_render_with_unknown_value_writes_nothing(tmp_path):
+    with pytest.raises(ValueError, match="Unknown plotlyjs"):
+        _chart(save_path=tmp_path / "gdp.html", plotlyjs=True)()
+    assert not (tmp_path / "gdp.html").exists()
@@ -0,0 +1,31 @@
+import pytest
+
+from wbpyplot import wb_plot
+
+
+def test_report_counts_draws_and_restores_canvas():
+    figures = []
+
+    @wb_plot(title="Prices", pyplot=False, show=False, profile=True)
+    def chart(fig, axs):
+        figures.append(fig)
+        axs[0].plot([1, 2, 3], [2, 1, 3])
+
+    with chart():
+        report = chart.last_report
+        assert report.draw_count >= 1
+        assert "draw" not in figures[0].canvas.__dict__
+
+
+def test_failed_render_restores_canvas_draw():
+    figures = []
+
+    @wb_plot(pyplot=False, show=False, profile=True)
+    def chart(fig, axs):
+        figures.append(fig)
+        raise RuntimeError("bad data")
+
+    with pytest.raises(RuntimeError, match="bad data"):
+        chart()
+    # Only the class method is left; no counting wrapper on the instance
+    assert "draw" not in figures[0].canvas.__dict__
@@ -0,0 +1,46 @@
+import matplotlib
+import pytest
+
+from wbpyplot import wb_plot
+from wbpyplot.theme import compile_theme, wb_theme
+
+
+def _snapshot():
+    return {key: matplotlib.rcParams[key] for key in compile_theme()}
+
+
+def test_theme_applies_during_render_and_is_restored_after(tmp_path):
+    before = _snapshot()
+    seen = {}
+
+    @wb_plot(save_path=tmp_path / "chart.png", pyplot=False)
+    def chart(axs):
+        seen.update(_snapshot())
+        axs[0].plot([1, 2], [3, 4])
+
+    chart()
+
+    assert seen == compile_theme()
+    assert _snapshot() == before
+
+
+def test_theme_is_restored_after_a_failed_render():
+    before = _snapshot()
+
+    @wb_plot(pyplot=False, show=False)
+    def chart(axs):
+        raise KeyError("missing column")
+
+    with pytest.raises(KeyError):
+        chart()
+
+    assert _snapshot() == before
+
+
+def test_theme_restores_user_settings():
+    with matplotlib.rc_context({"lines.linewidth": 7.5, "axes.grid": False}):
+        with wb_theme():
+            assert matplotlib.rcParams["lines.linewidth"] == 2.0
+            assert matplotlib.rcParams["axes.grid"] is True
+        assert matplotlib.rcParams["lines.linewidth"] == 7.5
+        assert matplotlib.rcParams["axes.grid"] is False
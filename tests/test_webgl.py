@@ -0,0 +1,47 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from wbpyplot import wb_plot
+from wbpyplot.webgl import use_webgl
+
+
+def _xy(n):
+    x = np.arange(n, dtype=float)
+    return x, np.sin(x / 100)
+
+
+def test_large_scatter_traces_are_drawn_with_webgl():
+    x, y = _xy(60_000)
+
+    @wb_plot(title="Sensor readings", backend="plotly", show=False)
+    def chart(fig):
+        fig.add_scatter(x=x, y=y, mode="markers", name="Sensor")
+        fig.add_scatter(x=[0, 1], y=[1, 2], mode="lines", name="Target")
+
+    fig = chart()
+
+    big, small = fig.data
+    assert big.type == "scattergl" and small.type == "scatter"
+    assert big.name == "SENSOR" and len(big.x) == len(x)
+    # WB styling reaches the converted trace
+    assert big.marker.size == 8 and big.marker.line.color == "white"
+
+
+def test_traces_without_webgl_equivalent_stay_svg():
+    x, y = _xy(100)
+    fig = go.Figure()
+    fig.add_scatter(x=x, y=y, stackgroup="one")
+    fig.add_scatter(x=x, y=y, line_shape="spline")
+    fig.add_scatter(x=x, y=y, line_shape="hv", line_color="#FF9800")
+
+    assert use_webgl(fig, 50) == 1
+    assert [t.type for t in fig.data] == ["scatter", "scatter", "scattergl"]
+    assert fig.data[2].line.shape == "hv" and fig.data[2].line.color == "#FF9800"
+
+
+def test_webgl_threshold_none_keeps_svg():
+    x, y = _xy(100)
+    fig = go.Figure(go.Scatter(x=x, y=y))
+
+    assert use_webgl(fig, None) == 0
+    assert fig.data[0].type == "scatter"
@@ -1 +1,31 @@
-from .decorator import wb_plot
+# Public names are resolved on first access (PEP 562) so that importing the
+# package does not pull in Matplotlib, Plotly or NumPy.
+import importlib
+
+_LAZY_ATTRS = {
+    "wb_plot": ".decorator",
+    "FigureScope": ".decorator",
+    "RenderReport": ".profiling",
+    "set_render_hook": ".profiling",
+    "render_many": ".batch",
+    "RenderResult": ".batch",
+    "write_html_report": ".export",
+    "prepare_map": ".maps",
+    "LiveFigure": ".live",
+    "main": ".cli",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -1,12 +1,92 @@
-import matplotlib.pyplot as plt
-from matplotlib.ticker import FuncFormatter, MaxNLocator
+from collections import namedtuple
+
+from matplotlib.patches import Rectangle
+from matplotlib.ticker import MaxNLocator
 import matplotlib.ticker as mticker
 import numpy as np
 
-from .number_formatting import format_number
+from .number_formatting import format_number, format_numbers
+
+
+class NumberFormatter(mticker.Formatter):
+    """Tick formatter applying format_number(); all ticks of an axis are formatted in one vectorized call."""
+
+    def __call__(self, x, pos=None):
+        return format_number(x)
+
+    def format_ticks(self, values):
+        return format_numbers(np.asarray(values, dtype=float)).tolist()
+
+
+AxisDecorations = namedtuple("AxisDecorations", ["zero_line", "bar_labels"])
+AxisDecorations.__doc__ = """
+Data-dependent artists added by :func:`apply_axis_styling`: the zero line
+(or ``None``) and the bar value label texts. They are redone by
+:meth:`LiveFigure.update <wbpyplot.live.LiveFigure.update>` when data changes.
+"""
+
+ZERO_LINE_STYLE = dict(linewidth=1, color="#8A969F", zorder=5)
+
+
+def add_zero_line(ax, chart_type, is_horizontal=None):
+    """
+    Draw the zero line for ``chart_type`` on ``ax`` and return it, or
+    ``None`` when the chart gets none.
+
+    Line charts and vertical bars get a horizontal line at y=0 on linear
+    scales; horizontal bars get a vertical line at x=0 when 0 is within the
+    x limits.
+    """
+    if chart_type == "bar":
+        if is_horizontal is None:
+            is_horizontal = is_horizontal_bar(ax)
+    elif chart_type in ("line", "timeseries"):
+        is_horizontal = False
+    else:
+        return None
+
+    if not is_horizontal:
+        if ax.get_yscale() == "linear":
+            # Always show zero line for linear scales (matching Plotly behavior)
+            return ax.axhline(0, **ZERO_LINE_STYLE)
+    elif ax.get_xscale() == "linear":
+        # get_xlim() applies any pending autoscaling; no draw needed
+        x0, x1 = ax.get_xlim()
+        if x0 <= 0 <= x1:
+            return ax.axvline(0, **ZERO_LINE_STYLE)
+    return None
+
+
+def add_bar_labels(ax, wb_font_sizes):
+    """Label every bar on ``ax`` with its value; returns the label texts."""
+    texts = []
+    for container in ax.containers:
+        texts.extend(
+            ax.bar_label(
+                container,
+                fmt="%.0f",
+                label_type="edge",
+                padding=2,
+                fontsize=wb_font_sizes["s"],
+                fontweight="semibold",
+                color="#111111",
+            )
+        )
+    return texts
 
 
 def apply_axis_styling(ax, wb_font_sizes, wb_spacing, chart_type, is_multi_panel=False, bar_labels=True):
+    """
+    Apply World Bank axis styling for ``chart_type`` to ``ax``.
+
+    Returns
+    -------
+    AxisDecorations
+        The zero line and bar value labels that were added.
+    """
+    zero_line = None
+    value_labels = []
+
     # --- shared axis label + tick styling ---
     for axis in [ax.xaxis, ax.yaxis]:
         axis.label.set_fontsize(wb_font_sizes["s"])
@@ -32,23 +112,11 @@ def apply_axis_styling(ax, wb_font_sizes, wb_spacing, chart_type, is_multi_panel
     
     ax.tick_params(axis="y", which="both", length=0)
 
-    def add_zero_line_h():  # horizontal line at y=0
-        if ax.get_yscale() == "linear":
-            # Always show zero line for linear scales (matching Plotly behavior)
-            ax.axhline(0, linewidth=1, color="#8A969F", zorder=5)
-
-    def add_zero_line_v():  # vertical line at x=0
-        if ax.get_xscale() == "linear":
-            ax.figure.canvas.draw()
-            x0, x1 = ax.get_xlim()
-            if x0 <= 0 <= x1:
-                ax.axvline(0, linewidth=1, color="#8A969F", zorder=5)
-
     # For line/timeseries only: draw a zero line if 0 is in range. Scatter
     # (e.g. GDP vs life expectancy) usually doesn't need it and it can make
     # the plot look odd if the axis extends to 0.
     if chart_type in ("line", "timeseries"):
-        add_zero_line_h()
+        zero_line = add_zero_line(ax, chart_type)
 
     if chart_type == "scatter":
         x_pad = wb_spacing["xxs"]
@@ -79,18 +147,7 @@ def apply_axis_styling(ax, wb_font_sizes, wb_spacing, chart_type, is_multi_panel
 
     elif chart_type == "bar":
         # --- detect orientation from bar containers ---
-        ax.figure.canvas.draw()
-        is_horizontal = False
-        for container in ax.containers:
-            # BarContainer.patches are Rectangles
-            widths = [abs(p.get_width()) for p in container.patches]
-            heights = [abs(p.get_height()) for p in container.patches]
-            if widths and heights:
-                # If data runs along X (barh), widths >> heights (band thickness)
-                # If data runs along Y (bar), heights >> widths
-                if (sum(widths) / len(widths)) > (sum(heights) / len(heights)) * 2.5:
-                    is_horizontal = True
-                    break
+        is_horizontal = is_horizontal_bar(ax)
 
         # --- grid + ticks ---
         ax.grid(False, axis="x")
@@ -112,7 +169,7 @@ def apply_axis_styling(ax, wb_font_sizes, wb_spacing, chart_type, is_multi_panel
                 except TypeError:
                     ax.set_yticks(y_ticks)
                     ax.set_yticklabels(upper)
-            add_zero_line_v()
+            zero_line = add_zero_line(ax, chart_type, is_horizontal=True)
 
         else:
             # X is categorical (standard vertical bars)
@@ -128,21 +185,37 @@ def apply_axis_styling(ax, wb_font_sizes, wb_spacing, chart_type, is_multi_panel
                 except TypeError:
                     ax.set_xticks(x_ticks)
                     ax.set_xticklabels(upper)
-            add_zero_line_h()
+            zero_line = add_zero_line(ax, chart_type, is_horizontal=False)
 
         # --- bar value labels ---
         if bar_labels:
-            for container in ax.containers:
-                ax.bar_label(
-                    container,
-                    fmt="%.0f",
-                    label_type="edge",
-                    padding=2,
-                    fontsize=wb_font_sizes["s"],
-                    fontweight="semibold",
-                    color="#111111",
-                )
+            value_labels = add_bar_labels(ax, wb_font_sizes)
+
+    return AxisDecorations(zero_line, value_labels)
+
 
+def is_horizontal_bar(ax):
+    """
+    Whether the bars on ``ax`` run along X (``barh``), from the axes' data
+    only; no draw is needed.
+    """
+    for container in ax.containers:
+        # ax.bar / ax.barh record their orientation on the BarContainer
+        orientation = getattr(container, "orientation", None)
+        if orientation is not None:
+            if orientation == "horizontal":
+                return True
+            continue
+        # Bars added some other way: compare the patch extents in data units
+        patches = getattr(container, "patches", None) or []
+        widths = [abs(p.get_width()) for p in patches]
+        heights = [abs(p.get_height()) for p in patches]
+        if widths and heights:
+            # If data runs along X (barh), widths >> heights (band thickness)
+            # If data runs along Y (bar), heights >> widths
+            if (sum(widths) / len(widths)) > (sum(heights) / len(heights)) * 2.5:
+                return True
+    return False
 
 
 def detect_chart_type(ax):
@@ -157,7 +230,7 @@ def detect_chart_type(ax):
     if collections:
         return "scatter"
 
-    rects = [patch for patch in ax.patches if isinstance(patch, plt.Rectangle)]
+    rects = [patch for patch in ax.patches if isinstance(patch, Rectangle)]
     if rects:
         return "bar"
 
@@ -168,13 +241,11 @@ def tidy_numeric_ticks(ax, max_ticks=5, chart_type=None):
     """
     Apply World Bank number formatting to numeric axis tick labels.
 
-    Uses format_number() so that ticks follow the style guide: comma as
+    Uses format_numbers() so that ticks follow the style guide: comma as
     thousand separator, K/M/B scaling for large values, and consistent
     decimal places. Only overrides axes that use Matplotlib's default
     ScalarFormatter (numeric data); categorical axes are left unchanged.
     """
-    wb_fmt = FuncFormatter(lambda x, pos: format_number(x))
-
     for axis in (ax.xaxis, ax.yaxis):
         locs = axis.get_majorticklocs()
         if len(locs) == 0 or not np.issubdtype(type(locs[0]), np.floating):
@@ -186,4 +257,4 @@ def tidy_numeric_ticks(ax, max_ticks=5, chart_type=None):
         # Only override default scalar formatter (numeric axes); leave
         # categorical or custom formatters (e.g. bar chart categories) alone.
         if isinstance(axis.get_major_formatter(), mticker.ScalarFormatter):
-            axis.set_major_formatter(wb_fmt)
+            axis.set_major_formatter(NumberFormatter())
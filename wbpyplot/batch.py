@@ -0,0 +1,145 @@
+# batch.py
+import os
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+RenderResult = namedtuple(
+    "RenderResult", ["index", "save_path", "ok", "error", "seconds", "report"]
+)
+RenderResult.__doc__ = """
+Outcome of one job passed to :func:`render_many`.
+
+``error`` holds the formatted traceback when ``ok`` is ``False``;
+``report`` holds the job's :class:`~wbpyplot.profiling.RenderReport` when it
+was rendered with ``profile=True``.
+"""
+
+
+def _normalize_job(job):
+    # Jobs are dicts, or (func, args, options, save_path) tuples for brevity
+    if isinstance(job, dict):
+        return {
+            "func": job["func"],
+            "args": tuple(job.get("args", ())),
+            "kwargs": dict(job.get("kwargs", {})),
+            "options": dict(job.get("options", {})),
+            "save_path": job.get("save_path"),
+        }
+    func, args, options, save_path = (tuple(job) + (None,) * 4)[:4]
+    return {
+        "func": func,
+        "args": tuple(args or ()),
+        "kwargs": {},
+        "options": dict(options or {}),
+        "save_path": save_path,
+    }
+
+
+def _init_worker():
+    # Pay for the backend, Matplotlib's imports, fonts and theme validation
+    # once per worker process instead of in its first chart.
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+    from .theme import warm_font_cache
+
+    warm_font_cache()
+
+
+def _run_job(index, job):
+    from .decorator import wb_plot, FigureScope
+
+    start = time.perf_counter()
+    save_path = job["save_path"]
+    try:
+        func = job["func"]
+        options = dict(getattr(func, "wb_plot_options", {}))
+        if options:
+            # Already decorated: rebuild from the undecorated function so
+            # per-job options can override the decorator's.
+            func = func.__wrapped__
+        options.update(job["options"])
+        # Workers never display, so skip pyplot's figure manager by default
+        options["pyplot"] = job["options"].get("pyplot", False)
+        if save_path is not None:
+            options["save_path"] = save_path
+        save_path = options.get("save_path")
+        options["show"] = False
+
+        render = wb_plot(**options)(func)
+        result = render(*job["args"], **job["kwargs"])
+        if isinstance(result, FigureScope):
+            result.close()
+        elif options.get("backend", "mpl") == "mpl" and result is not None:
+            import matplotlib.pyplot as plt
+
+            plt.close(result[0])
+        return RenderResult(
+            index, save_path, True, None, time.perf_counter() - start, render.last_report
+        )
+    except Exception:
+        return RenderResult(
+            index, save_path, False, traceback.format_exc(), time.perf_counter() - start, None
+        )
+
+
+def render_many(jobs, workers=None):
+    """
+    Render many ``wb_plot`` charts in a pool of worker processes.
+
+    Each worker process switches Matplotlib to the Agg backend, loads the
+    bundled fonts and validates the World Bank theme once at start-up, then
+    renders the jobs it is handed. Charts are never shown, so every job that
+    should produce output needs a ``save_path``.
+
+    Parameters
+    ----------
+    jobs : iterable
+        Each job is either a dict with keys ``func`` (required), ``args``,
+        ``kwargs``, ``options`` and ``save_path``, or a
+        ``(func, args, options, save_path)`` tuple. ``func`` is a plotting
+        function, plain or already decorated with ``@wb_plot``; ``options``
+        are ``wb_plot`` keyword arguments and override the decorator's.
+        Functions and arguments must be picklable, so define plotting
+        functions at module level.
+    workers : int, optional
+        Number of worker processes. Defaults to ``os.cpu_count()``. With
+        ``workers=1`` the jobs run serially in the calling process.
+
+    Returns
+    -------
+    list of RenderResult
+        One result per job, in job order. Failed jobs carry the formatted
+        traceback in ``error``; they do not stop the other jobs.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        jobs = [
+            {"func": plot_country, "args": (iso,), "save_path": f"out/{iso}.png"}
+            for iso in countries
+        ]
+        results = render_many(jobs, workers=8)
+        failed = [r for r in results if not r.ok]
+    """
+    jobs = [_normalize_job(job) for job in jobs]
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1 or len(jobs) <= 1:
+        return [_run_job(i, job) for i, job in enumerate(jobs)]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), initializer=_init_worker) as pool:
+        futures = [pool.submit(_run_job, i, job) for i, job in enumerate(jobs)]
+        for i, future in enumerate(futures):
+            try:
+                results.append(future.result())
+            except Exception:
+                # e.g. the job could not be pickled or the worker died
+                results.append(
+                    RenderResult(i, jobs[i]["save_path"], False, traceback.format_exc(), 0.0, None)
+                )
+    return results
@@ -0,0 +1,97 @@
+# cli.py
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Modules that must not be loaded by `import wbpyplot` / `from wbpyplot import wb_plot`
+HEAVY_MODULES = ("matplotlib", "matplotlib.pyplot", "numpy", "plotly", "pandas", "shapely", "geopandas")
+
+_IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import wbpyplot
+from wbpyplot import wb_plot
+elapsed = (time.perf_counter() - start) * 1000
+print(elapsed)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def bench_import(repeat=5):
+    """
+    Time ``import wbpyplot; from wbpyplot import wb_plot`` in fresh
+    interpreters.
+
+    Returns ``(median_ms, heavy_modules)`` where ``heavy_modules`` lists any
+    of ``HEAVY_MODULES`` that the import loaded.
+    """
+    code = _IMPORT_PROBE.format(heavy=HEAVY_MODULES)
+    timings = []
+    heavy = set()
+    for _ in range(max(1, repeat)):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+        timings.append(float(out[0]))
+        heavy.update(m for m in (out[1] if len(out) > 1 else "").split(",") if m)
+    return statistics.median(timings), sorted(heavy)
+
+
+def _cmd_bench_import(args):
+    median_ms, heavy = bench_import(args.repeat)
+    print(f"import wbpyplot: {median_ms:.1f} ms (median of {args.repeat})")
+    failed = False
+    if heavy:
+        print(f"FAIL: import loaded {', '.join(heavy)}")
+        failed = True
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"FAIL: import took longer than {args.max_ms:g} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+def _cmd_warm_cache(args):
+    import time
+
+    start = time.perf_counter()
+    import matplotlib
+    from .theme import warm_font_cache
+
+    font_list = warm_font_cache()
+    print(f"Matplotlib cache: {matplotlib.get_cachedir()}")
+    if font_list is None:
+        print("FAIL: Matplotlib could not write its font list (is MPLCONFIGDIR writable?)")
+        return 1
+    print(f"font list: {font_list}")
+    print(f"warmed in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return 0
+
+
+def main(argv=None):
+    """Entry point for the ``wbpyplot`` command."""
+    parser = argparse.ArgumentParser(prog="wbpyplot")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench = commands.add_parser(
+        "bench-import",
+        help="time `import wbpyplot` and fail if it regresses",
+    )
+    bench.add_argument("--repeat", type=int, default=5, help="number of fresh interpreters to time")
+    bench.add_argument(
+        "--max-ms", type=float, default=25.0, help="fail when the median import time exceeds this"
+    )
+    bench.set_defaults(func=_cmd_bench_import)
+
+    warm = commands.add_parser(
+        "warm-cache",
+        help="build and persist the Matplotlib font list and load the bundled font (e.g. at image build time)",
+    )
+    warm.set_defaults(func=_cmd_warm_cache)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
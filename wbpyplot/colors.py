@@ -1,4 +1,8 @@
 # colors.py
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
 import numpy as np
 import matplotlib.colors as mcolors
 from cycler import cycler
@@ -242,14 +246,23 @@ def _resolve_from_registry(palette):
     return None
 
 
-def resolve_color_cycle_and_label_map(
-    palette=None,
-    n=None,
-):
-    """
-    Returns (cycler_or_None, label_map_or_None, text_map_or_None, cmap_or_None).
-    """
+CompiledPalette = namedtuple(
+    "CompiledPalette", ["name", "kind", "colors", "rgba", "label_map", "text_map", "cmap", "colorscale"]
+)
+CompiledPalette.__doc__ = """
+A registry palette resolved once into everything a render needs.
+
+``kind`` is ``"sequence"`` or ``"label_map"``. ``colors`` is a tuple of hex
+strings and ``rgba`` a read-only ``(n, 4)`` array of the same colors.
+``label_map``/``text_map`` are read-only label-to-color mappings
+(label-map palettes only). ``cmap`` and ``colorscale`` are the Matplotlib
+colormap and Plotly colorscale of sequential and diverging palettes.
+"""
 
+_compiled_palettes = {}
+
+
+def _compile_palette(name):
     def _force_mode(name: str, reg_tuple):
         if name in LABEL_MAP_ONLY and reg_tuple and reg_tuple[0] == "label_map":
             return ("label_map", reg_tuple[1])
@@ -257,37 +270,119 @@ def resolve_color_cycle_and_label_map(
             return ("sequence", reg_tuple[1])
         return reg_tuple
 
-    reg = _resolve_from_registry(palette) if isinstance(palette, str) else None
-    reg = _force_mode(palette, reg) if isinstance(palette, str) else reg
-
+    reg = _force_mode(name, _resolve_from_registry(name))
     if reg is None:
-        return None, None, None, None
-
+        return None
     kind, node = reg
 
-    # Build a Colormap object for sequential/diverging palettes
-    cmap = None
-    if isinstance(palette, str) and ("seq" in palette or "div" in palette):
+    label_map = text_map = None
+    if kind == "label_map":
+        label_map = MappingProxyType(dict(node))
+        colors = tuple(node.values())
+        comp_key = COMPANION_TEXT_ALIASES.get(name)
+        if comp_key and comp_key in PALETTES and isinstance(PALETTES[comp_key], dict):
+            text_map = MappingProxyType(dict(PALETTES[comp_key]))
+    else:
+        colors = tuple(node)
+
+    rgba = mcolors.to_rgba_array(colors)
+    rgba.flags.writeable = False
+
+    # Colormap and Plotly colorscale for sequential/diverging palettes. The
+    # colormap interpolates linearly between evenly spaced colors, which a
+    # colorscale with the same stops reproduces exactly.
+    cmap = colorscale = None
+    if kind == "sequence" and ("seq" in name or "div" in name):
         try:
-            seq = list(node)  # node is already an ordered list of hex colors
-            cmap = mcolors.LinearSegmentedColormap.from_list(palette, seq, N=256)
+            cmap = mcolors.LinearSegmentedColormap.from_list(name, list(colors), N=256)
         except Exception:
             cmap = None
+        if cmap is not None:
+            last = max(len(colors) - 1, 1)
+            colorscale = tuple((i / last, mcolors.to_hex(c)) for i, c in enumerate(colors))
 
-    if kind == "sequence":
-        colors = list(node)
-        if n is not None:
-            colors = colors[: int(n)]
-        return cycler(color=colors), None, None, cmap
+    return CompiledPalette(name, kind, colors, rgba, label_map, text_map, cmap, colorscale)
 
-    if kind == "label_map":
-        text_map = None
-        comp_key = COMPANION_TEXT_ALIASES.get(palette)
-        if comp_key and comp_key in PALETTES and isinstance(PALETTES[comp_key], dict):
-            text_map = dict(PALETTES[comp_key])
-        return None, node, text_map, None
 
-    return None, None, None, None
+def get_compiled_palette(palette):
+    """
+    Return the :class:`CompiledPalette` for a registry palette name, or
+    ``None`` for anything else (sequences, Colormaps, unknown names).
+
+    Palettes are compiled on first use and cached for the process.
+    """
+    if not isinstance(palette, str):
+        return None
+    try:
+        return _compiled_palettes[palette]
+    except KeyError:
+        compiled = _compiled_palettes[palette] = _compile_palette(palette)
+        return compiled
+
+
+def register_palette(name, colors, text_colors=None):
+    """
+    Add a custom palette to the registry under ``name``.
+
+    Parameters
+    ----------
+    name : str
+        Palette name passed as ``palette=`` to ``wb_plot``. Names containing
+        ``"seq"`` or ``"div"`` also get a continuous colormap.
+    colors : sequence or dict
+        Hex colors, either in cycle/gradient order or as a
+        ``{label: color}`` map to color elements by label.
+    text_colors : dict, optional
+        Companion ``{label: color}`` map for annotation text of a label map.
+
+    Returns
+    -------
+    CompiledPalette
+    """
+    if isinstance(colors, dict):
+        if not _looks_like_label_map(colors):
+            raise ValueError(f"Palette {name!r} must map labels to hex colors like '#1A2B3C'.")
+        node = dict(colors)
+    else:
+        node = list(colors)
+        if not _looks_like_sequence(node):
+            raise ValueError(f"Palette {name!r} must be a sequence of hex colors like '#1A2B3C'.")
+    if text_colors is not None:
+        if not _looks_like_label_map(text_colors):
+            raise ValueError(f"text_colors for {name!r} must map labels to hex colors.")
+        PALETTES[f"{name}_text"] = dict(text_colors)
+        COMPANION_TEXT_ALIASES[name] = f"{name}_text"
+        _compiled_palettes.pop(f"{name}_text", None)
+    PALETTES[name] = node
+    _compiled_palettes.pop(name, None)
+    _palette_cycler.cache_clear()
+    return get_compiled_palette(name)
+
+
+@lru_cache(maxsize=None)
+def _palette_cycler(name, n):
+    colors = _compiled_palettes[name].colors
+    if n is not None:
+        colors = colors[:n]
+    return cycler(color=list(colors))
+
+
+def resolve_color_cycle_and_label_map(
+    palette=None,
+    n=None,
+):
+    """
+    Returns (cycler_or_None, label_map_or_None, text_map_or_None, cmap_or_None).
+    """
+    compiled = get_compiled_palette(palette)
+    if compiled is None:
+        return None, None, None, None
+
+    if compiled.kind == "sequence":
+        cycle = _palette_cycler(compiled.name, None if n is None else int(n))
+        return cycle, None, None, compiled.cmap
+
+    return None, compiled.label_map, compiled.text_map, None
 
 
 def apply_color_map_to_axes(axs, label_map: dict[str, str]) -> None:
@@ -366,34 +461,178 @@ def apply_legend_marker_colors(axs, label_map: dict[str, str]) -> None:
 # -----------------------------------------------------------------------------
 # Continuous -> binned helpers + colorbar handling
 # -----------------------------------------------------------------------------
-def build_binned_cmap_and_norm_from_axes(axs, cmap, bins, mode="linear"):
+# Mappable data is scanned in chunks of about this many values
+BINNING_CHUNK_SIZE = 1 << 20
+# Quantile edges are computed in memory up to this many finite values;
+# beyond it they are found by streamed passes over the data
+EXACT_QUANTILE_LIMIT = 1_000_000
+# Default bound on the rank error of streamed quantile edges, as a fraction
+# of the number of values. Edges are only approximated within it when a
+# search cannot narrow a rank down to QUANTILE_COLLECT_LIMIT values.
+QUANTILE_ERROR = 1e-4
+# A streamed search collects the values left around a rank once there are
+# at most this many, and picks the exact one
+QUANTILE_COLLECT_LIMIT = 1 << 16
+# Histogram bins per search pass and most passes per search
+_QUANTILE_SEARCH_BINS = 1024
+_QUANTILE_MAX_PASSES = 16
+
+
+def _mappable_arrays(axs):
+    # Arrays of images (imshow) and collections (pcolormesh, contourf ->
+    # QuadMesh, PolyCollection) on the given axes
+    for ax in axs:
+        for artist in list(getattr(ax, "images", [])) + list(ax.collections):
+            arr = getattr(artist, "get_array", lambda: None)()
+            if arr is not None:
+                arr = np.asarray(arr)
+                if arr.size:
+                    yield arr
+
+
+def _finite_chunks(arrays, chunk_size=None):
+    # Finite values of ``arrays`` as 1-D chunks of about ``chunk_size``
+    # values; slices along the first axis are views, so no array is copied
+    # as a whole
+    chunk_size = chunk_size or BINNING_CHUNK_SIZE
+    for arr in arrays:
+        if arr.ndim == 0:
+            arr = arr.reshape(1)
+        step = max(1, chunk_size // max(1, arr.size // arr.shape[0]))
+        for start in range(0, arr.shape[0], step):
+            block = arr[start : start + step]
+            block = block[np.isfinite(block)]
+            if block.size:
+                yield block
+
+
+def _in_range(block, lo, hi, closed):
+    # Values of ``block`` in [lo, hi), or [lo, hi] when ``closed``
+    mask = block >= lo
+    mask &= block <= hi if closed else block < hi
+    return block[mask]
+
+
+def _streamed_order_statistics(axs, ranks, dmin, dmax, count, quantile_error):
+    # Values at the 0-based ``ranks`` of the sorted finite data, found
+    # without holding the data. Each pass histograms the value range still
+    # holding a rank and keeps the bin the rank falls in, so the range
+    # shrinks by _QUANTILE_SEARCH_BINS per pass however skewed the data is.
+    # Once a range holds few values they are collected and the rank picked
+    # exactly. A range holding more values than that but no more than
+    # ``quantile_error`` of the count (only with very large data) gives a
+    # value interpolated by rank, which misses it by at most those values.
+    ranks = np.asarray(ranks, dtype=np.int64)
+    n = len(ranks)
+    lo = np.full(n, float(dmin))
+    hi = np.full(n, float(dmax))
+    closed = np.ones(n, dtype=bool)
+    below = np.zeros(n, dtype=np.int64)
+    inside = np.full(n, count, dtype=np.int64)
+    values = np.full(n, np.nan)
+    tolerance = max(1, int(quantile_error * count))
+    nbins = _QUANTILE_SEARCH_BINS
+
+    def chunks():
+        return _finite_chunks(_mappable_arrays(axs))
+
+    for _ in range(_QUANTILE_MAX_PASSES):
+        # Ranks still searched, grouped by their range so each range is
+        # histogrammed once
+        groups = {}
+        for i in range(n):
+            if np.isnan(values[i]) and inside[i] > QUANTILE_COLLECT_LIMIT:
+                if inside[i] <= tolerance:
+                    # Close enough in rank; no further pass needed
+                    values[i] = lo[i] + (ranks[i] - below[i] + 0.5) / inside[i] * (hi[i] - lo[i])
+                else:
+                    groups.setdefault((lo[i], hi[i], closed[i]), []).append(i)
+        if not groups:
+            break
+        stats = {key: [np.zeros(nbins, dtype=np.int64), np.inf, -np.inf] for key in groups}
+        for block in chunks():
+            for key, acc in stats.items():
+                within = _in_range(block, *key)
+                if within.size:
+                    edges = np.linspace(key[0], key[1], nbins + 1)
+                    bins = np.minimum(np.searchsorted(edges, within, side="right") - 1, nbins - 1)
+                    acc[0] += np.bincount(bins, minlength=nbins)
+                    acc[1] = min(acc[1], float(within.min()))
+                    acc[2] = max(acc[2], float(within.max()))
+        for key, targets in groups.items():
+            hist, vmin, vmax = stats[key]
+            if vmin == vmax:
+                # A single repeated value
+                values[targets] = vmin
+                continue
+            edges = np.linspace(key[0], key[1], nbins + 1)
+            cum = np.cumsum(hist)
+            for i in targets:
+                b = min(int(np.searchsorted(cum, ranks[i] - below[i], side="right")), nbins - 1)
+                below[i] += cum[b - 1] if b else 0
+                inside[i] = hist[b]
+                closed[i] = closed[i] and b == nbins - 1
+                lo[i], hi[i] = edges[b], edges[b + 1]
+    else:
+        # Out of passes: interpolate by rank within what is left
+        for i in range(n):
+            if np.isnan(values[i]) and inside[i] > QUANTILE_COLLECT_LIMIT:
+                values[i] = lo[i] + (ranks[i] - below[i] + 0.5) / inside[i] * (hi[i] - lo[i])
+
+    collect = {}
+    for i in range(n):
+        if np.isnan(values[i]):
+            collect.setdefault((lo[i], hi[i], closed[i]), []).append(i)
+    if collect:
+        kept = {key: [] for key in collect}
+        for block in chunks():
+            for key in collect:
+                kept[key].append(_in_range(block, *key))
+        for key, targets in collect.items():
+            within = np.sort(np.concatenate(kept.pop(key)))
+            values[targets] = within[ranks[targets] - below[targets]]
+    return values
+
+
+def _streamed_quantiles(axs, qs, dmin, dmax, count, quantile_error):
+    # np.quantile's default (linear) method from streamed order statistics
+    positions = np.asarray(qs) * (count - 1)
+    floor = np.floor(positions).astype(np.int64)
+    ceil = np.minimum(floor + 1, count - 1)
+    ranks, inverse = np.unique(np.concatenate([floor, ceil]), return_inverse=True)
+    stats = _streamed_order_statistics(axs, ranks, dmin, dmax, count, quantile_error)[inverse]
+    low, high = stats[: len(qs)], stats[len(qs) :]
+    return low + (positions - floor) * (high - low)
+
+
+def build_binned_cmap_and_norm_from_axes(axs, cmap, bins, mode="linear", quantile_error=QUANTILE_ERROR):
     """
     Build (ListedColormap, BoundaryNorm) for all mappables on the given axes.
     bins : int -> number of bins (uniform/quantile)
            sequence -> explicit bin edges
+    quantile_error : float -> bound on the rank error of quantile edges, as
+           a fraction of the number of values, once there are more than
+           ``EXACT_QUANTILE_LIMIT`` finite values
+
+    The mappable arrays are scanned in chunks, so memory use does not grow
+    with their size. Quantile edges over large data come from a few
+    streamed passes and match ``np.quantile`` except in extreme cases, which
+    stay within ``quantile_error`` in rank.
     """
-    arrays = []
-    for ax in axs:
-        # images (imshow)
-        for im in getattr(ax, "images", []):
-            arr = getattr(im, "get_array", lambda: None)()
-            if arr is not None:
-                arr = np.asarray(arr)
-                if arr.size:
-                    arrays.append(arr)
-        # collections (pcolormesh, contourf -> QuadMesh, PolyCollection)
-        for coll in ax.collections:
-            arr = getattr(coll, "get_array", lambda: None)()
-            if arr is not None:
-                arr = np.asarray(arr)
-                if arr.size:
-                    arrays.append(arr)
-
-    if not arrays:
-        return None, None
-    data = np.concatenate([a.ravel() for a in arrays])
-    data = data[np.isfinite(data)]
-    if data.size == 0:
+    axs = list(axs)
+    # Exact min/max and count of the finite values in one streamed pass.
+    # Small data is kept so quantiles can be exact.
+    dmin, dmax, count = np.inf, -np.inf, 0
+    kept = []
+    for block in _finite_chunks(_mappable_arrays(axs)):
+        dmin = min(dmin, float(block.min()))
+        dmax = max(dmax, float(block.max()))
+        count += block.size
+        if count <= EXACT_QUANTILE_LIMIT:
+            kept.append(block)
+        else:
+            kept = None
+    if count == 0:
         return None, None
 
     # Compute edges
@@ -406,9 +645,13 @@ def build_binned_cmap_and_norm_from_axes(axs, cmap, bins, mode="linear"):
         nbins = int(bins)
         if str(mode).lower() == "quantile":
             qs = np.linspace(0, 1, nbins + 1)
-            edges = np.quantile(data, qs)
+            if kept is not None:
+                edges = np.quantile(np.concatenate(kept), qs)
+            elif dmin == dmax:
+                edges = np.full(qs.size, dmin)
+            else:
+                edges = _streamed_quantiles(axs, qs, dmin, dmax, count, quantile_error)
         else:  # linear
-            dmin, dmax = float(np.nanmin(data)), float(np.nanmax(data))
             if not np.isfinite(dmin) or not np.isfinite(dmax) or dmin == dmax:
                 return None, None
             edges = np.linspace(dmin, dmax, nbins + 1)
@@ -492,3 +735,26 @@ def apply_cmap_to_mappables(axs, cmap, norm=None, force_recreate_cb=True):
                     cb.update_normal(m)
                 except Exception:
                     pass
+
+
+def replace_collection(ax, old, make_new):
+    """
+    Swap the collection ``old`` on ``ax`` for the one ``make_new()`` draws.
+
+    The collections that followed ``old`` are added again after the new one,
+    so the legend keeps its order, and a colorbar drawn for ``old`` is
+    pointed at the new collection.
+    """
+    colorbar = getattr(old, "colorbar", None)
+    later = ax.collections[ax.collections.index(old) + 1 :]
+    old.remove()
+    new = make_new()
+    for other in later:
+        other.remove()
+        ax.add_collection(other, autolim=False)
+
+    if colorbar is not None:
+        new.colorbar = colorbar
+        new.colorbar_cid = new.callbacks.connect("changed", colorbar.update_normal)
+        colorbar.update_normal(new)
+    return new
@@ -1,23 +1,10 @@
 # decorator.py
 from functools import wraps
-import inspect
-import matplotlib.pyplot as plt
-import numpy as np
-
-from .theme import get_dynamic_sizes, wb_rcparams
-from .layout import render_title_subtitle_note, compute_total_bottom_margin, px_to_fig_frac
-from .legend import render_legend_below_plot, should_suppress_legend
-from .axis import apply_axis_styling, detect_chart_type, tidy_numeric_ticks
-from matplotlib.collections import PathCollection
-from .number_formatting import format_number
-from .colors import (
-    resolve_color_cycle_and_label_map,
-    apply_color_map_to_axes,
-    apply_annotation_text_colors,
-    apply_legend_marker_colors,
-    apply_cmap_to_mappables,
-    build_binned_cmap_and_norm_from_axes,
-)
+
+# Matplotlib, Plotly, NumPy, inspect, the bundled font and the palette
+# machinery are imported inside the render functions so that
+# `import wbpyplot` stays cheap.
+from .profiling import start_report, finish_report
 
 
 def wb_plot(
@@ -39,6 +26,15 @@ def wb_plot(
     backend="mpl",
     show=True,
     bar_labels=True,
+    profile=False,
+    pyplot=True,
+    scatter_density=False,
+    downsample=False,
+    rasterize_threshold=10_000,
+    webgl_threshold=50_000,
+    plotlyjs="inline",
+    simplify_geojson=False,
+    live=False,
 ):
     """
     Create a standardized plotting theme via a decorator for the World Bank with consistent styling,
@@ -98,6 +94,84 @@ def wb_plot(
     bar_labels : bool, default=True
         Whether to add value labels on bar charts (Matplotlib and Plotly).
         Set to ``False`` to omit automatic bar value labels.
+    profile : bool, default=False
+        Whether to time each render stage. The resulting
+        :class:`~wbpyplot.profiling.RenderReport` (wall time per stage,
+        number of ``canvas.draw()`` calls and artist counts) is stored on the
+        decorated function as ``last_report`` after every call. Use
+        :func:`~wbpyplot.profiling.set_render_hook` to collect reports from
+        all renders instead.
+    pyplot : bool, default=True
+        Whether to create the figure through ``matplotlib.pyplot``
+        (Matplotlib only). With ``pyplot=False`` the figure is built on an
+        Agg canvas without registering it with pyplot's figure manager, so
+        long-running services don't accumulate open figures. The figure is
+        never displayed: if ``save_path`` is set it is saved and released
+        and the call returns ``None``; otherwise the call returns a
+        :class:`FigureScope` context manager that yields ``(fig, axs)`` and
+        releases the figure on exit.
+    scatter_density : bool or int, default=False
+        Whether to draw very large scatters as a density layer (Matplotlib
+        only). With ``True``, scatters of 100,000 points or more are
+        replaced by a hexbin layer colored with a World Bank sequential
+        palette (the ``palette`` if it is sequential, otherwise
+        ``wb_seq_monochrome_blue``); an int sets the point threshold.
+        Render time then depends on the figure size rather than the number
+        of points. Color-mapped scatters keep their colormap and show the
+        mean value per cell.
+    downsample : bool or int, default=False
+        Whether to thin out long line series before drawing (Matplotlib
+        ``Line2D`` and Plotly ``scatter`` line traces). With ``True`` each
+        line keeps about two points per horizontal pixel of the plot,
+        chosen with Largest-Triangle-Three-Buckets so the visual shape and
+        the minimum and maximum are preserved; an int sets the number of
+        points per line. Lines with missing values or unsorted x values,
+        and marker-only lines, are drawn in full. Large rasters
+        (``imshow``, ``pcolormesh`` and Plotly ``heatmap``) are likewise
+        reduced to about two cells per pixel, averaging blocks of float
+        values, taking the most common value of integer (categorical) ones
+        and sampling RGB(A) images.
+    rasterize_threshold : int or None, default=10_000
+        Element count from which data artists are rasterized when
+        ``save_path`` is a vector format (SVG, PDF, EPS; Matplotlib only).
+        Lines with that many points and collections (scatters, meshes,
+        hexbins, contours) with that many markers, cells or vertices are
+        embedded as images at the figure ``dpi``, which keeps files small
+        and quick to open; text, axes, grid lines, titles, notes and the
+        legend stay vector. ``None`` keeps everything vector.
+    webgl_threshold : int or None, default=50_000
+        Point count from which Plotly ``scatter`` traces are converted to
+        WebGL ``scattergl`` traces, which stay responsive with millions of
+        points (Plotly only). WB styling is applied to the converted traces
+        as usual. ``None`` keeps every trace as SVG.
+    plotlyjs : {"inline", "directory"} or str, default="inline"
+        How the HTML written to ``save_path`` loads plotly.js (Plotly only):
+        - ``"inline"``: embed the ~3.5 MB bundle in every file.
+        - ``"directory"``: reference a shared ``plotly.min.js`` next to
+          the HTML file, written on first use.
+        - a path ending in ``.js``: reference the bundle at that path,
+          written on first use. A relative path is resolved against the
+          current working directory, not the HTML file's directory; the
+          HTML refers to the bundle by its path relative to the HTML file.
+        Shared bundles keep batch exports small and work offline; an
+        existing bundle file is reused as-is.
+    simplify_geojson : bool or float, default=False
+        Whether to simplify the GeoJSON of ``choropleth`` traces to the
+        figure's pixel resolution before it is embedded (Plotly only).
+        Boundaries are simplified to half a pixel of the figure ``width``
+        and their coordinates rounded to match, which typically shrinks
+        world maps by an order of magnitude; a float sets the tolerance in
+        pixels. Processed GeoJSON is cached by content, so repeated maps
+        reuse it. GeoJSON given as a URL is left alone.
+    live : bool, default=False
+        Whether to return a :class:`~wbpyplot.live.LiveFigure` instead of
+        ``(fig, axs)`` (Matplotlib only). Its ``update`` method swaps line,
+        scatter and bar data in place and redoes only the data-dependent
+        styling (limits, tick formatting, bar labels, zero line), keeping
+        the titles, notes, legend and margins of the first render; when
+        the limits do not change only the data is redrawn, by blitting.
+        With ``show=True`` the figure is shown without blocking so it can
+        be updated. For dashboards that refresh every few seconds.
 
     Notes
     -----
@@ -161,13 +235,49 @@ def wb_plot(
         The created figure object. Type depends on ``backend``.
     axes : array of matplotlib.axes.Axes, optional
         The subplot axes array (Matplotlib backend only).
+    live : wbpyplot.live.LiveFigure
+        Returned instead of the above with ``live=True``.
     """
 
+    # Kept on the decorated function so batch rendering can rebuild it
+    options = dict(
+        width=width,
+        height=height,
+        dpi=dpi,
+        nrows=nrows,
+        ncols=ncols,
+        save_path=save_path,
+        title=title,
+        subtitle=subtitle,
+        note=note,
+        legend_title=legend_title,
+        palette=palette,
+        palette_n=palette_n,
+        palette_bins=palette_bins,
+        palette_bin_mode=palette_bin_mode,
+        include_insets=include_insets,
+        backend=backend,
+        show=show,
+        bar_labels=bar_labels,
+        profile=profile,
+        pyplot=pyplot,
+        scatter_density=scatter_density,
+        downsample=downsample,
+        rasterize_threshold=rasterize_threshold,
+        webgl_threshold=webgl_threshold,
+        plotlyjs=plotlyjs,
+        simplify_geojson=simplify_geojson,
+        live=live,
+    )
+
     def decorator(plot_func):
         @wraps(plot_func)
         def wrapper(*args, **kwargs):
+            if live and backend != "mpl":
+                raise ValueError("live=True requires backend='mpl'; Plotly figures can be updated through fig.data.")
+            report = start_report(backend, profile)
             if backend == "mpl":
-                return _render_mpl(
+                result = _render_mpl(
                     plot_func,
                     args,
                     kwargs,
@@ -188,9 +298,15 @@ def wb_plot(
                     include_insets=include_insets,
                     show=show,
                     bar_labels=bar_labels,
+                    pyplot=pyplot,
+                    scatter_density=scatter_density,
+                    downsample=downsample,
+                    rasterize_threshold=rasterize_threshold,
+                    live=live,
+                    report=report,
                 )
             elif backend == "plotly":
-                return _render_plotly(
+                result = _render_plotly(
                     plot_func,
                     args,
                     kwargs,
@@ -205,18 +321,40 @@ def wb_plot(
                     palette_n=palette_n,
                     show=show,
                     bar_labels=bar_labels,
+                    downsample=downsample,
+                    webgl_threshold=webgl_threshold,
+                    plotlyjs=plotlyjs,
+                    simplify_geojson=simplify_geojson,
+                    report=report,
                 )
             else:
                 raise ValueError(
                     f"Unknown backend {backend!r}. Must be 'mpl' or 'plotly'."
                 )
+            wrapper.last_report = finish_report(report)
+            return result
 
+        wrapper.last_report = None
+        wrapper.wb_plot_options = options
         return wrapper
 
     return decorator
 
 
-def _render_mpl(
+def _render_mpl(plot_func, args, kwargs, **options):
+    """Render using Matplotlib backend."""
+    from .theme import wb_theme
+
+    # Theme applies to rcParams only while the figure is built and saved
+    with wb_theme():
+        try:
+            return _render_mpl_themed(plot_func, args, kwargs, **options)
+        finally:
+            # A render that raised never reached report.finish()
+            options["report"].unwatch_canvas()
+
+
+def _render_mpl_themed(
     plot_func,
     args,
     kwargs,
@@ -238,11 +376,42 @@ def _render_mpl(
     include_insets,
     show,
     bar_labels,
+    pyplot,
+    scatter_density,
+    downsample,
+    rasterize_threshold,
+    live,
+    report,
 ):
-    """Render using Matplotlib backend."""
-    # Apply global rcparams/theme
-    plt.rcParams.update(wb_rcparams)
-    
+    import inspect
+    import numpy as np
+    from matplotlib.collections import PathCollection
+
+    from .theme import get_dynamic_sizes
+    from .layout import (
+        render_title_subtitle_note,
+        render_top_ylabel,
+        compute_total_bottom_margin,
+        px_to_fig_frac,
+        add_text_specs,
+        layout_cache_key,
+        get_cached_layout,
+        store_layout,
+    )
+    from .legend import render_legend_below_plot, should_suppress_legend
+    from .axis import apply_axis_styling, detect_chart_type, tidy_numeric_ticks
+    from .density import density_threshold, aggregate_dense_scatters
+    from .downsample import downsample_lines, downsample_rasters
+    from .export import is_vector_format, rasterize_heavy_artists
+    from .colors import (
+        resolve_color_cycle_and_label_map,
+        apply_color_map_to_axes,
+        apply_annotation_text_colors,
+        apply_legend_marker_colors,
+        apply_cmap_to_mappables,
+        build_binned_cmap_and_norm_from_axes,
+    )
+
     # Calculate figure size in inches
     figsize_inches = (width / dpi, height / dpi)
     
@@ -255,14 +424,27 @@ def _render_mpl(
     font_sizes = {k: max(8, int(v * scale_factor)) for k, v in font_sizes.items()}
 
     # Figure/axes
-    fig, axs = plt.subplots(
-        nrows=nrows,
-        ncols=ncols,
-        figsize=figsize_inches,
-        dpi=dpi,
-    )
+    if pyplot:
+        import matplotlib.pyplot as plt
+
+        fig, axs = plt.subplots(
+            nrows=nrows,
+            ncols=ncols,
+            figsize=figsize_inches,
+            dpi=dpi,
+        )
+    else:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        # Standalone Agg figure: never registered with pyplot's figure manager
+        fig = Figure(figsize=figsize_inches, dpi=dpi)
+        FigureCanvasAgg(fig)
+        axs = fig.subplots(nrows=nrows, ncols=ncols)
     axs = axs.flatten() if isinstance(axs, (list, np.ndarray)) else [axs]
     is_multi_panel = (nrows * ncols) > 1
+    report.watch_canvas(fig)
+    report.mark("setup")
 
     # --- Resolve colors (cycle / label_map / text_map / continuous cmap) ---
     cycle, label_map, text_map, cmap = resolve_color_cycle_and_label_map(
@@ -274,6 +456,7 @@ def _render_mpl(
     if cycle is not None:
         for ax in axs:
             ax.set_prop_cycle(cycle)
+    report.mark("palette")
 
     # === User plotting ===
     # Support both legacy signatures (axs, *args, **kwargs)
@@ -293,6 +476,21 @@ def _render_mpl(
         # Legacy signature: def func(axs, *args, **kwargs)
         # Pass axs, then all user-provided args
         plot_func(axs, *args, **kwargs)
+    report.mark("user_plot")
+
+    # Replace huge scatters with a density layer before any restyling
+    threshold = density_threshold(scatter_density)
+    if threshold is not None:
+        aggregate_dense_scatters(
+            fig.get_axes() if include_insets else axs,
+            threshold,
+            cmap=cmap,
+        )
+        report.mark("scatter_density")
+
+    if downsample:
+        downsample_lines(fig.get_axes() if include_insets else axs, downsample)
+        report.mark("downsample")
 
     # Determine which axes to include in styling / color handling.
     if include_insets:
@@ -325,16 +523,26 @@ def _render_mpl(
     # Annotation text colors (NOT legend text)
     if text_map:
         apply_annotation_text_colors(axes_for_styling, text_map)
+    report.mark("colormaps")
 
-    # Axes styling / tidy ticks
+    # Rasters are reduced once their colors and bins are set from the full data
+    if downsample and downsample_rasters(axes_for_styling, downsample):
+        report.mark("downsample")
+
+    # Axes styling / tidy ticks. Chart types are detected once, before
+    # styling adds zero lines, and reused below.
+    chart_types = {}
+    decorations = {}
     for ax in axes_for_styling:
-        chart_type = detect_chart_type(ax)
-        apply_axis_styling(
+        chart_type = chart_types[ax] = detect_chart_type(ax)
+        decorations[ax] = apply_axis_styling(
             ax, font_sizes, spacing, chart_type,
             is_multi_panel=is_multi_panel,
             bar_labels=bar_labels,
         )
+        report.mark("axis_styling")
         tidy_numeric_ticks(ax, max_ticks=5, chart_type=chart_type)
+        report.mark("tick_formatting")
 
     # Scatter markers: larger size with white outline
     _SCATTER_MARKER_AREA = 42  # ~6.5pt radius
@@ -350,9 +558,9 @@ def _render_mpl(
                     col.set_sizes(np.full(n, _SCATTER_MARKER_AREA))
                 col.set_edgecolors("white")
                 col.set_linewidths(0.8)
+    report.mark("scatter_markers")
 
     # --- Titles, subtitles, notes, legend layout ---
-    fig.canvas.draw()
     handles, labels = axs[0].get_legend_handles_labels()
     existing_ax_legend = axs[0].get_legend()
     # GeoPandas categorical maps can build an in-axes Legend artist while
@@ -363,69 +571,95 @@ def _render_mpl(
         handles, labels = [], []
     show_legend = bool(handles) and not is_multi_panel
 
-    y_top, note_margin_frac, x_margin_frac = render_title_subtitle_note(
-        fig, title, subtitle, note, font_sizes, spacing
-    )
-    
     # For single-panel line/timeseries charts: move Y-axis title to top (underneath subtitle)
+    top_ylabel = None
     if not is_multi_panel:
         for ax in axes_for_styling:
-            chart_type = detect_chart_type(ax)
-            if chart_type in ("line", "timeseries"):
-                ylabel_text = ax.get_ylabel()
-                if ylabel_text:
-                    # Remove Y-axis label from left side
-                    ax.set_ylabel("")
-                    # Add Y-axis label as text annotation at top (underneath subtitle)
-                    fig.canvas.draw()
-                    renderer = fig.canvas.get_renderer()
-                    ylabel_artist = fig.text(
-                        x_margin_frac,
-                        y_top,
-                        ylabel_text,
-                        fontsize=font_sizes["s"],
-                        fontweight="semibold",
-                        color="#111111",
-                        ha="left",
-                        va="top",
-                        linespacing=1.2,
-                    )
-                    fig.canvas.draw()
-                    bbox = ylabel_artist.get_window_extent(renderer=renderer)
-                    ylabel_height_frac = bbox.height / (fig.get_size_inches()[1] * fig.dpi)
-                    # Adjust y_top to account for Y-axis label
-                    y_top -= ylabel_height_frac + px_to_fig_frac(spacing["s"], fig, "y")
-                    break  # Only do this for the first axis
-    
-    if is_multi_panel:
-        # Subplot grids keep per-panel axis labels inside each axes; reserve space for notes only.
-        total_bottom_margin_frac = (
-            note_margin_frac + px_to_fig_frac(spacing["l"], fig, "y")
-            if note
-            else px_to_fig_frac(spacing["m"], fig, "y")
+            chart_type = chart_types[ax]
+            # Bar charts with a zero line get the top title like line charts
+            if chart_type == "bar" and ax.get_lines():
+                chart_type = "line"
+            if chart_type in ("line", "timeseries") and ax.get_ylabel():
+                top_ylabel = ax.get_ylabel()
+                # Remove Y-axis label from left side
+                ax.set_ylabel("")
+                break  # Only do this for the first axis
+
+    # Everything the title/note/margin geometry depends on; charts sharing
+    # this chrome reuse the measured layout instead of measuring again.
+    layout_key = layout_cache_key(
+        fig,
+        nrows,
+        ncols,
+        font_sizes,
+        spacing,
+        title,
+        subtitle,
+        note,
+        top_ylabel,
+        labels,
+        bool(handles),
+        legend_title,
+        [(bool(ax.get_xlabel()), bool(ax.get_ylabel())) for ax in axs],
+    )
+    layout = get_cached_layout(layout_key)
+    if layout is None:
+        text_specs = []
+        y_top, note_margin_frac, x_margin_frac = render_title_subtitle_note(
+            fig, title, subtitle, note, font_sizes, spacing, text_specs=text_specs
         )
+        if top_ylabel:
+            # Add Y-axis label as text annotation at top (underneath subtitle)
+            y_top = render_top_ylabel(
+                fig, top_ylabel, x_margin_frac, y_top, font_sizes, spacing, text_specs=text_specs
+            )
+
+        if is_multi_panel:
+            # Subplot grids keep per-panel axis labels inside each axes; reserve space for notes only.
+            total_bottom_margin_frac = (
+                note_margin_frac + px_to_fig_frac(spacing["l"], fig, "y")
+                if note
+                else px_to_fig_frac(spacing["m"], fig, "y")
+            )
+        else:
+            total_bottom_margin_frac = compute_total_bottom_margin(
+                fig, axs, handles, note, note_margin_frac, spacing
+            )
+
+        # Left/right margins: keep compact so plot area gets more width
+        left_margin_frac = px_to_fig_frac(spacing["s"], fig, "x")
+        right_margin_frac = px_to_fig_frac(spacing["s"], fig, "x")
+        has_ylabel = any(ax.get_ylabel() for ax in axs)
+        if has_ylabel:
+            left_margin_frac += px_to_fig_frac(spacing["l"], fig, "x")
+
+        layout = {
+            "text_specs": text_specs,
+            "y_top": y_top,
+            "note_margin_frac": note_margin_frac,
+            "x_margin_frac": x_margin_frac,
+            "total_bottom_margin_frac": total_bottom_margin_frac,
+            # Margins with padding to prevent overlap
+            "subplots_adjust": dict(
+                top=y_top,
+                bottom=total_bottom_margin_frac,
+                left=left_margin_frac,
+                right=1.0 - right_margin_frac,
+                hspace=0.2 if nrows > 1 else None,  # Add spacing between subplots if multiple rows
+                wspace=0.2 if ncols > 1 else None,  # Add spacing between subplots if multiple columns
+            ),
+        }
+        store_layout(layout_key, layout)
     else:
-        total_bottom_margin_frac = compute_total_bottom_margin(
-            fig, axs, handles, note, note_margin_frac, spacing
-        )
-    
-    # Left/right margins: keep compact so plot area gets more width
-    left_margin_frac = px_to_fig_frac(spacing["s"], fig, "x")
-    right_margin_frac = px_to_fig_frac(spacing["s"], fig, "x")
-    has_ylabel = any(ax.get_ylabel() for ax in axs)
-    if has_ylabel:
-        left_margin_frac += px_to_fig_frac(spacing["l"], fig, "x")
-    
-    # Apply margins with padding to prevent overlap
-    # Use subplots_adjust with all margins set
-    fig.subplots_adjust(
-        top=y_top,
-        bottom=total_bottom_margin_frac,
-        left=left_margin_frac,
-        right=1.0 - right_margin_frac,
-        hspace=0.2 if nrows > 1 else None,  # Add spacing between subplots if multiple rows
-        wspace=0.2 if ncols > 1 else None,  # Add spacing between subplots if multiple columns
-    )
+        add_text_specs(fig, layout["text_specs"])
+    report.mark("titles_notes")
+
+    y_top = layout["y_top"]
+    note_margin_frac = layout["note_margin_frac"]
+    x_margin_frac = layout["x_margin_frac"]
+    total_bottom_margin_frac = layout["total_bottom_margin_frac"]
+    fig.subplots_adjust(**layout["subplots_adjust"])
+    report.mark("margins")
     
     # Apply tight_layout AFTER subplots_adjust to ensure no overlap.
     # Multi-panel: only constrain top (title/subtitle); let hspace/wspace handle panel labels.
@@ -441,6 +675,7 @@ def _render_mpl(
         # If tight_layout fails (e.g., incompatible backend), 
         # subplots_adjust should still provide reasonable spacing
         pass
+    report.mark("tight_layout")
 
     # Remove in-axes legend only when replacing with the WB custom legend.
     # Keep map legends that exist as in-axes Legend artists only.
@@ -448,6 +683,7 @@ def _render_mpl(
         existing_ax_legend.remove()
 
     fig.canvas.draw()
+    report.mark("draw")
 
     if show_legend:
         # Place legend strictly within the reserved bottom margin, between
@@ -463,10 +699,12 @@ def _render_mpl(
         )
         legend_y = note_margin_frac + legend_padding
         render_legend_below_plot(fig, handles, labels, spacing, legend_y, x_margin_frac, legend_title, font_sizes)
+    report.mark("legend")
     
     # Final tight_layout call after all elements (including legend) are rendered
     # This ensures proper spacing even when the window is resized
     fig.canvas.draw()
+    report.mark("draw")
     try:
         fig.tight_layout(
             rect=tight_rect,
@@ -476,6 +714,7 @@ def _render_mpl(
         )
     except Exception:
         pass
+    report.mark("tight_layout")
     
     # Add resize callback to handle window resizing in interactive environments.
     # This recalculates spacing when the window is resized by re-applying
@@ -509,14 +748,78 @@ def _render_mpl(
         pass
 
     if save_path:
-        fig.savefig(save_path, bbox_inches="tight")
-    elif show:
-        plt.show()
+        savefig_kwargs = {}
+        if is_vector_format(save_path):
+            # Heavy data layers become images; typography stays vector
+            if rasterize_heavy_artists(fig, rasterize_threshold):
+                report.mark("rasterize")
+            savefig_kwargs["dpi"] = fig.dpi
+        fig.savefig(save_path, bbox_inches="tight", **savefig_kwargs)
+        report.mark("savefig")
+    elif show and pyplot:
+        if live:
+            # Keep running so the figure can be updated
+            plt.show(block=False)
+        else:
+            plt.show()
+        report.mark("show")
+    report.finish(fig)
+
+    if live:
+        from .live import LiveFigure
+
+        return LiveFigure(
+            fig, axs, chart_types, decorations, font_sizes, bar_labels=bar_labels, downsample=downsample
+        )
+
+    if not pyplot:
+        # Once saved, nothing else needs the figure
+        if save_path:
+            _release_figure(fig)
+            return None
+        return FigureScope(fig, axs)
 
     # Return None when showing so Quarto/Jupyter don't print (fig, axs)
     return None if show else (fig, axs)
 
 
+def _release_figure(fig):
+    # Drop axes and artists so the figure holds no data even if the caller
+    # keeps a reference to it.
+    fig.clear()
+
+
+class FigureScope:
+    """
+    Context manager returned by ``wb_plot(pyplot=False)`` renders.
+
+    Entering yields ``(fig, axs)``; leaving releases the figure.
+
+    .. code-block:: python
+
+        with plot_gdp(df) as (fig, axs):
+            fig.savefig("gdp.svg")
+    """
+
+    def __init__(self, fig, axs):
+        self.fig = fig
+        self.axs = axs
+
+    def __enter__(self):
+        return self.fig, self.axs
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self):
+        """Release the figure. Safe to call more than once."""
+        if self.fig is not None:
+            _release_figure(self.fig)
+            self.fig = None
+            self.axs = None
+
+
 def _render_plotly(
     plot_func,
     args,
@@ -533,6 +836,11 @@ def _render_plotly(
     palette_n,
     show,
     bar_labels,
+    downsample,
+    webgl_threshold,
+    plotlyjs,
+    simplify_geojson,
+    report,
 ):
     """Render using Plotly backend."""
     try:
@@ -542,6 +850,16 @@ def _render_plotly(
         raise ImportError(
             "Plotly backend requires plotly package. Install with: pip install plotly"
         )
+    import inspect
+    import numpy as np
+
+    from .theme import get_dynamic_sizes, wb_rcparams
+    from .colors import resolve_color_cycle_and_label_map, get_compiled_palette
+    from .downsample import downsample_heatmaps, downsample_traces
+    from .webgl import use_webgl
+    from .plotly_traces import classify_traces, style_traces, bar_category_ticks
+    from .export import plotlyjs_script_src
+    from .maps import simplify_trace_geojson
 
     # Get dynamic font sizes and spacing (matching Matplotlib)
     font_sizes, spacing = get_dynamic_sizes(width)
@@ -558,6 +876,7 @@ def _render_plotly(
 
     # Create figure
     fig = go.Figure()
+    report.mark("setup")
 
     # Resolve colors for Plotly
     cycle, label_map, text_map, cmap = resolve_color_cycle_and_label_map(
@@ -565,15 +884,11 @@ def _render_plotly(
         n=palette_n,
     )
 
-    # Store colorscale for later application to traces
+    # Store colorscale for later application to traces; compiled once per
+    # palette with the same evenly spaced stops as the Matplotlib colormap
     colorscale = None
     if cmap is not None:
-        # Convert Matplotlib colormap to Plotly colorscale
-        colorscale = []
-        for i in range(256):
-            rgba = cmap(i / 255.0)
-            rgb = f"rgb({int(rgba[0]*255)}, {int(rgba[1]*255)}, {int(rgba[2]*255)})"
-            colorscale.append([i / 255.0, rgb])
+        colorscale = [list(stop) for stop in get_compiled_palette(palette).colorscale]
 
     # Apply colorway for discrete palettes
     if cycle is not None:
@@ -588,6 +903,7 @@ def _render_plotly(
             default_colors = default_cycle.by_key().get("color", [])
             if default_colors:
                 fig.update_layout(colorway=default_colors)
+    report.mark("palette")
 
     # Call user plotting function
     # For Plotly, we pass fig as the first argument (similar to Matplotlib's fig, axs)
@@ -610,6 +926,19 @@ def _render_plotly(
     else:
         # New: def func(fig, *args, **kwargs)
         plot_func(fig, *args, **kwargs)
+    report.mark("user_plot")
+
+    if downsample:
+        downsample_traces(fig, downsample, width)
+        downsample_heatmaps(fig, downsample, width, height)
+        report.mark("downsample")
+
+    if simplify_trace_geojson(fig, simplify_geojson, width):
+        report.mark("simplify_geojson")
+
+    # Large scatters are drawn with WebGL; styling below covers both types
+    if use_webgl(fig, webgl_threshold):
+        report.mark("webgl")
 
     # Capture Y-axis title immediately after user function (before we modify layout)
     # This is needed for line charts with temporal X-axis where we move Y-axis title to top
@@ -624,129 +953,6 @@ def _render_plotly(
     except (AttributeError, TypeError):
         pass
 
-    # Apply colorscale to traces that support it (if continuous palette)
-    if colorscale:
-        for trace in fig.data:
-            # Apply colorscale to traces that have z values (choropleth, heatmaps, etc.)
-            if hasattr(trace, "z") and trace.z is not None:
-                trace.colorscale = colorscale
-                # Choropleth from px.choropleth often uses layout.coloraxis; clear it so
-                # this trace uses its own colorscale (WB palette).
-                if hasattr(trace, "coloraxis") and getattr(trace, "coloraxis", None):
-                    trace.coloraxis = None
-            # For scatter plots with color values
-            elif hasattr(trace, "marker") and hasattr(trace.marker, "color"):
-                if isinstance(trace.marker.color, (list, np.ndarray)):
-                    trace.marker.colorscale = colorscale
-
-    # Apply label-based color mapping if needed
-    if label_map:
-        # Update trace colors based on legend labels
-        for trace in fig.data:
-            if hasattr(trace, "name") and trace.name in label_map:
-                color = label_map[trace.name]
-                if hasattr(trace, "marker"):
-                    trace.marker.color = color
-                if hasattr(trace, "line"):
-                    trace.line.color = color
-                if hasattr(trace, "fillcolor"):
-                    trace.fillcolor = color
-    
-    # Apply default line width and marker size to traces
-    # Plotly marker size 6 (keep previous size); white outline on scatter markers
-    for trace in fig.data:
-        if hasattr(trace, "line") and trace.line is not None:
-            if not hasattr(trace.line, "width") or trace.line.width is None:
-                trace.line.width = 2.0
-        # Scatter traces only: marker size and white outline (Bar traces have no marker.size)
-        if (
-            getattr(trace, "type", None) == "scatter"
-            and hasattr(trace, "marker")
-            and trace.marker is not None
-        ):
-            if not hasattr(trace.marker, "size") or trace.marker.size is None:
-                trace.marker.size = 8
-            trace.marker.line = dict(color="white", width=1)
-
-    # Choropleth/map: detect so we can set geo.domain and apply WB layout
-    has_choropleth = any(getattr(t, "type", None) == "choropleth" for t in fig.data)
-
-    # Bar charts: value labels beside bars (like matplotlib bar_label), no grid in bar direction
-    has_bar = any(getattr(t, "type", None) == "bar" for t in fig.data)
-    is_bar_chart_horizontal = any(
-        getattr(t, "orientation", None) == "h" for t in fig.data if getattr(t, "type", None) == "bar"
-    ) if has_bar else False
-    if has_bar and bar_labels:
-        def _bar_fmt(v):
-            if isinstance(v, (int, float)):
-                return str(int(v)) if v == int(v) else str(round(v, 2))
-            return str(v)
-        for trace in fig.data:
-            if getattr(trace, "type", None) != "bar":
-                continue
-            # Value labels beside bars (values are in y for vertical, x for horizontal)
-            vals = trace.y if getattr(trace, "orientation", None) != "h" else trace.x
-            if vals is not None:
-                vlist = list(vals) if hasattr(vals, "__iter__") and not isinstance(vals, str) else [vals]
-                trace.text = [_bar_fmt(v) for v in vlist]
-                trace.textposition = "outside"
-
-    # Detect if this is a line chart with temporal X-axis (matching Matplotlib behavior)
-    # For line charts with temporal X-axis only: remove X-axis label and tick marks.
-    # Do NOT apply to scatter plots or other chart types (they keep X-axis title).
-    # A line chart is temporal if: 1) trace mode includes "lines" (not just "markers"),
-    # 2) X-axis is datetime-like OR numeric.
-    is_line_chart_with_temporal_x = False
-    if fig.data:
-        # Only treat as line chart when traces actually draw lines (mode contains "lines")
-        has_lines = any(
-            hasattr(trace, "mode") and trace.mode and "lines" in str(trace.mode)
-            for trace in fig.data
-        )
-
-        if has_lines:
-            # Check if Plotly has detected it as a date axis (user may have set this)
-            if hasattr(fig.layout, "xaxis") and hasattr(fig.layout.xaxis, "type"):
-                if fig.layout.xaxis.type in ("date", "date-time"):
-                    is_line_chart_with_temporal_x = True
-            
-            # Also check X-axis data for datetime-like values
-            if not is_line_chart_with_temporal_x:
-                for trace in fig.data:
-                    if hasattr(trace, "x") and trace.x is not None:
-                        x_data = trace.x
-                        # Check if it's datetime-like (pandas datetime, numpy datetime64)
-                        if hasattr(x_data, "dtype"):
-                            if np.issubdtype(x_data.dtype, np.datetime64):
-                                is_line_chart_with_temporal_x = True
-                                break
-                        elif isinstance(x_data, (list, tuple)) and len(x_data) > 0:
-                            # Check first element - could be pandas Timestamp, datetime, or date string
-                            first_val = x_data[0]
-                            if hasattr(first_val, "__class__"):
-                                class_name = first_val.__class__.__name__
-                                if any(dt_type in class_name for dt_type in ["Timestamp", "datetime", "date", "Date"]):
-                                    is_line_chart_with_temporal_x = True
-                                    break
-            
-            # If still not detected, check if X-axis is numeric (line charts with numeric X are typically temporal)
-            # This handles cases like years (2010, 2011, etc.) that aren't datetime objects
-            if not is_line_chart_with_temporal_x:
-                for trace in fig.data:
-                    if hasattr(trace, "x") and trace.x is not None:
-                        x_data = trace.x
-                        # Check if it's numeric (int or float)
-                        if hasattr(x_data, "dtype"):
-                            if np.issubdtype(x_data.dtype, np.number):
-                                is_line_chart_with_temporal_x = True
-                                break
-                        elif isinstance(x_data, (list, tuple)) and len(x_data) > 0:
-                            # Check if first element is numeric
-                            first_val = x_data[0]
-                            if isinstance(first_val, (int, float, np.integer, np.floating)):
-                                is_line_chart_with_temporal_x = True
-                                break
-
     # Preserve user-set axis titles (e.g. scatter: xaxis_title="GDP per capita")
     # Only clear titles for temporal line charts; otherwise keep what the user set
     def _get_axis_title(fig, axis_name):
@@ -765,6 +971,35 @@ def _render_plotly(
     existing_xaxis_title = _get_axis_title(fig, "xaxis")
     existing_yaxis_title = _get_axis_title(fig, "yaxis")
 
+    # Classify traces once, then style each trace with a single update:
+    # colorscale, label_map colors, line widths, scatter markers, bar value
+    # labels, data label fonts, uppercase legend names and hover templates.
+    summary = classify_traces(fig)
+    has_choropleth = summary.has_choropleth
+    has_bar = summary.has_bar
+    is_bar_chart_horizontal = summary.is_bar_horizontal
+    is_line_chart_with_temporal_x = summary.is_line_chart_with_temporal_x
+    has_legend = summary.has_legend
+
+    # Apply default text font to traces that show data labels (e.g. bar charts)
+    # so labels use the theme font size instead of Plotly's default
+    default_text_font = {
+        "size": font_sizes["s"],
+        "color": "#111111",
+        "family": f"{font_family_name}, sans-serif",
+    }
+    style_traces(
+        fig,
+        summary,
+        colorscale=colorscale,
+        label_map=label_map,
+        bar_labels=bar_labels,
+        text_font=default_text_font,
+        x_title=existing_xaxis_title or "X",
+        y_title=yaxis_title_text_early or existing_yaxis_title or "Y",
+    )
+    report.mark("trace_styling")
+
     def _build_axis_title_dict(is_temporal, existing_title, font_size, font_family, standoff=None):
         """Build x/y axis title dict. Only set 'text' when we have a value so merge preserves user title."""
         d = {
@@ -981,18 +1216,6 @@ def _render_plotly(
     # note_margin_frac: position after last note (for compatibility with other calculations)
     note_margin_frac = y_note if notes_to_render else 0
     
-    # Check if there are legend items and uppercase labels to match Matplotlib
-    has_legend = len(fig.data) > 0 and any(
-        hasattr(trace, "name") and trace.name and trace.name != ""
-        for trace in fig.data
-    )
-    
-    # Uppercase legend labels to match Matplotlib behavior
-    if has_legend:
-        for trace in fig.data:
-            if hasattr(trace, "name") and trace.name:
-                trace.name = trace.name.upper()
-    
     # Calculate bottom margin dynamically (matching Matplotlib's compute_total_bottom_margin)
     # X-axis label: user-set title (existing_xaxis_title) or we set it in layout
     has_xlabel = bool(existing_xaxis_title) or (
@@ -1163,83 +1386,29 @@ def _render_plotly(
     # Set annotations
     layout_updates["annotations"] = annotations
 
-    fig.update_layout(**layout_updates)
-
-    # Apply default text font to traces that show data labels (e.g. bar charts)
-    # so labels use the theme font size instead of Plotly's default; bar value labels are bold
-    default_text_font = {
-        "size": font_sizes["s"],
-        "color": "#111111",
-        "family": f"{font_family_name}, sans-serif",
-    }
-    bar_text_font = {**default_text_font, "weight": "bold"}
-    for trace in fig.data:
-        if getattr(trace, "text", None) is not None or getattr(trace, "texttemplate", None) is not None:
-            font = bar_text_font if getattr(trace, "type", None) == "bar" else default_text_font
-            if getattr(trace, "insidetextfont", None) is None or trace.insidetextfont == {}:
-                trace.insidetextfont = font.copy()
-            if getattr(trace, "outsidetextfont", None) is None or trace.outsidetextfont == {}:
-                trace.outsidetextfont = font.copy()
-            if getattr(trace, "textfont", None) is None or trace.textfont == {}:
-                trace.textfont = font.copy()
-
-    # Apply custom hovertemplate per World Bank style guide when not set by user.
-    # Use customdata so numbers show with 2 decimals and strings show as-is (avoid NaN for categories).
-    x_title = existing_xaxis_title or "X"
-    y_title = yaxis_title_text_early or (yaxis_title_text if is_line_chart_with_temporal_x else None) or existing_yaxis_title or "Y"
-
-    def _hover_fmt(val):
-        if isinstance(val, (int, float)) and not np.isnan(val):
-            return str(int(val)) if val == int(val) else str(round(val, 2))
-        return str(val) if val is not None else ""
-
-    for trace in fig.data:
-        if getattr(trace, "hovertemplate", None) is None and getattr(
-            trace, "x", None
-        ) is not None and getattr(trace, "y", None) is not None:
-            x_vals = list(trace.x) if hasattr(trace.x, "__iter__") and not isinstance(trace.x, str) else [trace.x]
-            y_vals = list(trace.y) if hasattr(trace.y, "__iter__") and not isinstance(trace.y, str) else [trace.y]
-            trace.customdata = [[_hover_fmt(x), _hover_fmt(y)] for x, y in zip(x_vals, y_vals)]
-            separator_line = "_" * 30
-            trace.hovertemplate = (
-                f"{x_title}: <b>%{{customdata[0]}}</b><br>"
-                f"{separator_line}<br>"
-                f"{y_title}: <b>%{{customdata[1]}}</b>"
-                "<extra></extra>"
-            )
-
     # Zero line along the value axis: for bar charts use the axis bars extend along (x for horizontal, y for vertical);
     # for line/scatter etc. always show y-axis zeroline (linear scale)
     zeroline_style = dict(zeroline=True, zerolinewidth=1, zerolinecolor="#8A969F")
-    if has_bar:
-        if is_bar_chart_horizontal:
-            fig.update_layout(xaxis=zeroline_style)
-        else:
-            fig.update_layout(yaxis=zeroline_style)
-    else:
-        fig.update_layout(yaxis=zeroline_style)
+    value_axis = "xaxis" if has_bar and is_bar_chart_horizontal else "yaxis"
+    layout_updates[value_axis].update(zeroline_style)
 
     # Bar charts: categorical axis tick labels uppercase and bold
     if has_bar:
-        bar_trace = next((t for t in fig.data if getattr(t, "type", None) == "bar"), None)
-        if bar_trace is not None:
-            if is_bar_chart_horizontal:
-                cat_vals = bar_trace.y
-            else:
-                cat_vals = bar_trace.x
-            if cat_vals is not None:
-                categories = list(cat_vals) if hasattr(cat_vals, "__iter__") and not isinstance(cat_vals, str) else [cat_vals]
-                ticktext = [str(c).upper() for c in categories]
-                cat_tickfont = {"size": font_sizes["s"], "color": "#666666", "weight": "bold"}
-                if is_bar_chart_horizontal:
-                    fig.update_layout(yaxis=dict(tickvals=categories, ticktext=ticktext, tickfont=cat_tickfont))
-                else:
-                    fig.update_layout(xaxis=dict(tickvals=categories, ticktext=ticktext, tickfont=cat_tickfont))
+        cat_tickfont = {"size": font_sizes["s"], "color": "#666666", "weight": "bold"}
+        category_ticks = bar_category_ticks(summary, cat_tickfont)
+        if category_ticks is not None:
+            cat_axis = "yaxis" if is_bar_chart_horizontal else "xaxis"
+            layout_updates[cat_axis].update(category_ticks)
+
+    fig.update_layout(**layout_updates)
+    report.mark("layout")
 
     # Save; rely on the caller / environment to display the returned figure.
     # Most notebook/IDE environments auto-render a returned Plotly Figure,
     # and in scripts users can call `fig.show()` explicitly.
     if save_path:
-        fig.write_html(save_path)
+        fig.write_html(save_path, include_plotlyjs=plotlyjs_script_src(plotlyjs, save_path))
+        report.mark("write_html")
+    report.finish(fig)
 
     return fig
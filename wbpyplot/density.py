@@ -0,0 +1,87 @@
+# density.py
+import numpy as np
+from matplotlib.collections import PathCollection
+
+from .colors import replace_collection, resolve_color_cycle_and_label_map
+
+# Scatters with at least this many points are aggregated when
+# scatter_density=True
+DENSITY_THRESHOLD = 100_000
+
+# Approximate hexagon width in pixels
+HEX_SIZE_PX = 6
+
+DEFAULT_DENSITY_PALETTE = "wb_seq_monochrome_blue"
+
+
+def density_threshold(scatter_density):
+    """Point threshold for the ``scatter_density`` option, or ``None`` if off."""
+    if scatter_density is True:
+        return DENSITY_THRESHOLD
+    if not scatter_density:
+        return None
+    return int(scatter_density)
+
+
+def aggregate_dense_scatters(axes, threshold, cmap=None):
+    """
+    Replace scatters of ``threshold`` points or more with a hexbin density layer.
+
+    Drawing hundreds of thousands of markers is slow and the result is
+    overplotted; a hexbin layer draws one polygon per occupied cell, so the
+    cost follows the output size rather than the point count. Cells are
+    sized from the axes' pixel width. Plain scatters are colored by point
+    count (log scale) with ``cmap``, a World Bank sequential palette;
+    color-mapped scatters (``c=values``) keep their colormap and norm and
+    show the mean value per cell. The scatter's label, z-order and colorbar
+    carry over to the density layer.
+
+    Returns
+    -------
+    list of PolyCollection
+        The density layers that were added.
+    """
+    if cmap is None:
+        cmap = resolve_color_cycle_and_label_map(DEFAULT_DENSITY_PALETTE)[3]
+
+    added = []
+    for ax in axes:
+        for col in list(ax.collections):
+            if not isinstance(col, PathCollection) or col.get_offset_transform() != ax.transData:
+                continue
+            offsets = np.asarray(col.get_offsets(), dtype=float)
+            if len(offsets) < threshold:
+                continue
+            added.append(_replace_with_hexbin(ax, col, offsets, cmap))
+    return added
+
+
+def _replace_with_hexbin(ax, col, offsets, cmap):
+    values = col.get_array()
+    is_mapped = values is not None and np.size(values) == len(offsets)
+
+    keep = np.isfinite(offsets).all(axis=1)
+    if is_mapped:
+        values = np.asarray(values, dtype=float)
+        keep &= np.isfinite(values)
+
+    # Grid resolution from the axes' size on the figure; no draw needed
+    width_px = ax.get_window_extent().width
+    gridsize = max(10, int(width_px / HEX_SIZE_PX))
+
+    kwargs = dict(
+        gridsize=gridsize,
+        xscale=ax.get_xscale() if ax.get_xscale() == "log" else "linear",
+        yscale=ax.get_yscale() if ax.get_yscale() == "log" else "linear",
+        linewidths=0,
+        edgecolors="face",
+        label=col.get_label(),
+        zorder=col.get_zorder(),
+    )
+    if is_mapped:
+        kwargs.update(C=values[keep], reduce_C_function=np.mean, cmap=col.get_cmap(), norm=col.norm)
+    else:
+        kwargs.update(cmap=cmap, bins="log", mincnt=1)
+
+    # The density layer takes the scatter's place and colorbar
+    return replace_collection(ax, col, lambda: ax.hexbin(offsets[keep, 0], offsets[keep, 1], **kwargs))
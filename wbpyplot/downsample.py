@@ -0,0 +1,421 @@
+# downsample.py
+import numpy as np
+
+from .colors import replace_collection
+
+# Points kept per line, as a multiple of the plot's width in pixels
+POINTS_PER_PIXEL = 2
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; the points in between are
+    split into ``n_out - 2`` buckets and from each bucket the point forming
+    the largest triangle with the previously kept point and the mean of the
+    next bucket is kept. The global minimum and maximum of ``y`` are added
+    if LTTB did not already pick them, so the result can have up to two
+    more than ``n_out`` points.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        Finite float arrays of equal length, ``x`` sorted ascending.
+    n_out : int
+        Number of points to keep.
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted integer indices into ``x`` and ``y``.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets over the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    # The bucket after the last one is the final point
+    mean_x = np.append(mean_x[1:], x[-1])
+    mean_y = np.append(mean_y[1:], y[-1])
+
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0] = 0
+    idx[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs(
+            (x[a] - mean_x[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (mean_y[i] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+
+    return np.union1d(idx, [int(np.argmin(y)), int(np.argmax(y))])
+
+
+def downsample_target(downsample, width_px):
+    """Points to keep per line for the ``downsample`` option, or ``None`` if off."""
+    if downsample is True:
+        return max(3, int(POINTS_PER_PIXEL * width_px))
+    if not downsample:
+        return None
+    return int(downsample)
+
+
+def _reducible(x, y, n_out):
+    # LTTB assumes a function of x: finite values with x sorted ascending
+    return (
+        n_out is not None
+        and len(x) > n_out
+        and np.isfinite(x).all()
+        and np.isfinite(y).all()
+        and (np.diff(x) >= 0).all()
+    )
+
+
+def downsample_lines(axes, downsample):
+    """
+    Reduce every long ``Line2D`` on ``axes`` with LTTB.
+
+    Lines are reduced to about twice the axes' width in pixels (or to
+    ``downsample`` points if it is an int), which keeps their visual shape
+    and extremes while bounding draw time and file size by the output
+    resolution. Lines with missing values or unsorted x values are left
+    alone, as are marker-only lines (no line style), whose every point is
+    drawn. The kept points are set in their original type, so dates and
+    unit-aware data keep working.
+
+    Returns
+    -------
+    int
+        Number of lines that were reduced.
+    """
+    if not downsample:
+        return 0
+    reduced = 0
+    for ax in axes:
+        n_out = downsample_target(downsample, ax.get_window_extent().width)
+        for line in ax.get_lines():
+            if line.get_transform() != ax.transData:
+                continue
+            # Marker-only lines are point data; dropping points would hide
+            # data (Plotly traces without "lines" are skipped the same way)
+            if line.get_linestyle() in ("None", "", " "):
+                continue
+            xy = line.get_xydata()
+            if len(xy) <= n_out:
+                continue
+            # Work in scaled coordinates so log axes are reduced as displayed
+            x = ax.xaxis.get_transform().transform(xy[:, 0])
+            y = ax.yaxis.get_transform().transform(xy[:, 1])
+            if not _reducible(x, y, n_out):
+                continue
+            idx = lttb_indices(x, y, n_out)
+            xorig, yorig = line.get_data(orig=True)
+            line.set_data(np.asarray(xorig)[idx], np.asarray(yorig)[idx])
+            reduced += 1
+    return reduced
+
+
+def _block_starts(n, n_out):
+    # First index of each block when reducing n cells to at most n_out
+    return np.arange(0, n, -(-n // n_out))
+
+
+# Integer rasters spanning at most this many values are counted per block
+# with bincount; wider ones are sorted
+_MODE_BINCOUNT_VALUES = 1 << 12
+
+
+def _block_mode(band, col_starts):
+    # Most common unmasked value in each column block of a band of rows,
+    # the smallest one on ties; masked where a block has no values
+    blocks = np.searchsorted(col_starts, np.arange(band.shape[1]), side="right") - 1
+    valid = ~np.ma.getmaskarray(band)
+    blocks = np.broadcast_to(blocks, band.shape)[valid]
+    cells = np.ma.getdata(band)[valid].astype(np.int64)
+    nblocks = len(col_starts)
+    out = np.ma.masked_all(nblocks, dtype=band.dtype)
+    if not cells.size:
+        return out
+    low = cells.min()
+    span = int(cells.max() - low) + 1
+    if span <= _MODE_BINCOUNT_VALUES:
+        counts = np.bincount(blocks * span + (cells - low), minlength=nblocks * span).reshape(nblocks, span)
+        found = counts.any(axis=1)
+        out[found] = low + counts[found].argmax(axis=1)
+        return out
+    order = np.lexsort((cells, blocks))
+    blocks, cells = blocks[order], cells[order]
+    starts = np.flatnonzero(np.r_[True, (np.diff(blocks) != 0) | (np.diff(cells) != 0)])
+    lengths = np.diff(np.append(starts, cells.size))
+    # Longest run first within each block; stable, so smaller values win ties
+    runs = starts[np.lexsort((-lengths, blocks[starts]))]
+    found, first = np.unique(blocks[runs], return_index=True)
+    out[found] = cells[runs[first]]
+    return out
+
+
+def _reduce_raster(values, row_starts, col_starts):
+    # RGB(A) images are sampled at the first cell of each block; other
+    # integer (categorical) rasters get each block's most common value and
+    # float rasters the mean of each block's finite cells
+    if values.dtype.kind in "biu":
+        if values.ndim == 3:
+            return values[row_starts[:, None], col_starts]
+        out = np.ma.masked_all((len(row_starts), len(col_starts)), dtype=values.dtype)
+        bounds = np.append(row_starts, values.shape[0])
+        for i in range(len(row_starts)):
+            out[i] = _block_mode(values[bounds[i] : bounds[i + 1]], col_starts)
+        return out if np.ma.is_masked(out) else out.data
+    out = np.empty((len(row_starts), len(col_starts)) + values.shape[2:])
+    bounds = np.append(row_starts, values.shape[0])
+    # One band of rows at a time, so temporaries stay the size of the output
+    for i in range(len(row_starts)):
+        band = np.ma.filled(values[bounds[i] : bounds[i + 1]], np.nan).astype(float)
+        finite = np.isfinite(band)
+        sums = np.add.reduceat(np.where(finite, band, 0).sum(axis=0), col_starts, axis=0)
+        counts = np.add.reduceat(finite.sum(axis=0), col_starts, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[i] = sums / counts
+    return out
+
+
+def _raster_blocks(shape, downsample, width_px, height_px):
+    # Row and column block starts, or None when the raster is already small
+    rows = _block_starts(shape[0], downsample_target(downsample, height_px))
+    cols = _block_starts(shape[1], downsample_target(downsample, width_px))
+    if len(rows) == shape[0] and len(cols) == shape[1]:
+        return None
+    return rows, cols
+
+
+def _reduce_quadmesh(ax, mesh, downsample, bbox):
+    # Replace ``mesh`` by a coarser pcolormesh over the same cell edges
+    values = mesh.get_array()
+    coords = mesh.get_coordinates()
+    if values is None or values.ndim != 2 or coords.shape[:2] != (values.shape[0] + 1, values.shape[1] + 1):
+        # Gouraud shading or a flattened array
+        return None
+    blocks = _raster_blocks(values.shape, downsample, bbox.width, bbox.height)
+    if blocks is None:
+        return None
+    rows, cols = blocks
+    grid = coords[np.append(rows, values.shape[0])[:, None], np.append(cols, values.shape[1])]
+
+    reduced = _reduce_raster(values, rows, cols)
+    # The coarser mesh takes the original's place and colorbar
+    return replace_collection(
+        ax,
+        mesh,
+        lambda: ax.pcolormesh(
+            grid[..., 0],
+            grid[..., 1],
+            reduced,
+            cmap=mesh.get_cmap(),
+            norm=mesh.norm,
+            alpha=mesh.get_alpha(),
+            zorder=mesh.get_zorder(),
+            label=mesh.get_label(),
+        ),
+    )
+
+
+def downsample_rasters(axes, downsample):
+    """
+    Reduce large ``imshow`` images and ``pcolormesh`` meshes on ``axes``.
+
+    Rasters are reduced to about twice the axes' size in pixels in each
+    direction (or to ``downsample`` cells per side if it is an int), so
+    colormapping and resampling at draw time work on an array the size of
+    the output. Float rasters are reduced to the mean of each block of
+    cells, ignoring missing values; integer rasters (categories) to the most
+    common value of each block, and RGB(A) images keep the first cell of
+    each block. Images keep their extent; meshes are
+    replaced by a coarser mesh over the same edges, with the same colormap,
+    norm and colorbar.
+
+    Returns
+    -------
+    int
+        Number of rasters that were reduced.
+    """
+    from matplotlib.collections import QuadMesh
+    from matplotlib.image import AxesImage
+
+    if not downsample:
+        return 0
+    reduced = 0
+    for ax in axes:
+        bbox = ax.get_window_extent()
+        for im in ax.images:
+            # Non-uniform and pcolor images have their own set_data
+            if type(im) is not AxesImage:
+                continue
+            values = im.get_array()
+            if values is None or values.ndim < 2:
+                continue
+            blocks = _raster_blocks(values.shape, downsample, bbox.width, bbox.height)
+            if blocks is None:
+                continue
+            extent = im.get_extent()
+            im.set_data(_reduce_raster(values, *blocks))
+            # The default extent follows the array shape; keep the original
+            im.set_extent(extent)
+            reduced += 1
+        for mesh in [c for c in ax.collections if isinstance(c, QuadMesh)]:
+            if mesh.get_transform() == ax.transData and _reduce_quadmesh(ax, mesh, downsample, bbox) is not None:
+                reduced += 1
+    return reduced
+
+
+def _numeric_x(x):
+    # Plotly x values as floats, or None when they are categorical
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(float)
+    if x.dtype.kind in "biuf":
+        return x.astype(float)
+    if x.dtype.kind == "O":
+        try:
+            return x.astype(float)
+        except (TypeError, ValueError):
+            pass
+    if x.dtype.kind in "OUS":
+        # Date strings or datetime objects
+        try:
+            return x.astype("datetime64[ns]").astype(np.int64).astype(float)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+# Per-point trace attributes that must be reduced together with x and y
+_PER_POINT_ATTRS = ("text", "hovertext", "customdata")
+
+
+def downsample_traces(fig, downsample, width_px):
+    """
+    Reduce long Plotly line traces (``scatter``/``scattergl`` with lines) with LTTB.
+
+    Same rules as :func:`downsample_lines`, with the target derived from
+    the figure width. Per-point ``text``, ``hovertext`` and ``customdata``
+    are reduced alongside; traces with per-point marker styling are left
+    alone.
+
+    Returns
+    -------
+    int
+        Number of traces that were reduced.
+    """
+    n_out = downsample_target(downsample, width_px)
+    if n_out is None:
+        return 0
+    reduced = 0
+    for trace in fig.data:
+        if trace.type not in ("scatter", "scattergl") or trace.y is None:
+            continue
+        if trace.mode is not None and "lines" not in trace.mode:
+            continue
+        if not np.isscalar(trace.marker.color) and trace.marker.color is not None:
+            continue
+        if not np.isscalar(trace.marker.size) and trace.marker.size is not None:
+            continue
+        try:
+            y = np.asarray(trace.y, dtype=float)
+        except (TypeError, ValueError):
+            continue
+        if trace.x is None:
+            # Implicit x (x0 + i * dx) becomes explicit once points are dropped
+            x0 = 0 if trace.x0 is None else trace.x0
+            dx = 1 if trace.dx is None else trace.dx
+            if not isinstance(x0, (int, float)):
+                continue
+            xvals = x0 + dx * np.arange(len(y))
+        else:
+            xvals = np.asarray(trace.x)
+        x = _numeric_x(xvals)
+        if x is None or len(x) != len(y) or not _reducible(x, y, n_out):
+            continue
+
+        idx = lttb_indices(x, y, n_out)
+        update = {"x": xvals[idx], "y": np.asarray(trace.y)[idx]}
+        for attr in _PER_POINT_ATTRS:
+            vals = trace[attr]
+            if vals is not None and not isinstance(vals, str) and len(vals) == len(y):
+                update[attr] = np.asarray(vals)[idx]
+        trace.update(update)
+        reduced += 1
+    return reduced
+
+
+def _reduce_coords(coords, starts, n):
+    # Heatmap x/y for the reduced z: cell edges are subset, numeric or
+    # datetime cell centers become the middle of each block
+    coords = np.asarray(coords)
+    if len(coords) == n + 1:
+        return coords[np.append(starts, n)]
+    if len(coords) != n or coords.dtype.kind not in "iufM":
+        return None
+    ends = np.append(starts[1:], n) - 1
+    return coords[starts] + (coords[ends] - coords[starts]) / 2
+
+
+def downsample_heatmaps(fig, downsample, width_px, height_px):
+    """
+    Reduce large Plotly ``heatmap`` traces to about twice the figure size in pixels.
+
+    ``z`` is reduced like the rasters in :func:`downsample_rasters`, and
+    ``x``/``y`` follow the reduced cells. Heatmaps with per-cell text or
+    custom data, with categorical axes, or transposed are left alone.
+
+    Returns
+    -------
+    int
+        Number of traces that were reduced.
+    """
+    if not downsample:
+        return 0
+    reduced = 0
+    for trace in fig.data:
+        if trace.type != "heatmap" or trace.z is None or trace.transpose:
+            continue
+        if any(trace[attr] is not None for attr in ("text", "hovertext", "customdata")):
+            continue
+        z = np.asarray(trace.z)
+        if z.dtype.kind not in "biuf":
+            try:
+                z = z.astype(float)
+            except (TypeError, ValueError):
+                continue
+        if z.ndim != 2:
+            continue
+        blocks = _raster_blocks(z.shape, downsample, width_px, height_px)
+        if blocks is None:
+            continue
+        rows, cols = blocks
+
+        update = {}
+        for axis, starts, n in (("x", cols, z.shape[1]), ("y", rows, z.shape[0])):
+            coords = trace[axis]
+            if coords is None:
+                # Implicit coordinates (x0 + i * dx) become explicit
+                start = 0 if trace[axis + "0"] is None else trace[axis + "0"]
+                step = 1 if trace["d" + axis] is None else trace["d" + axis]
+                if not isinstance(start, (int, float)):
+                    break
+                coords = start + step * np.arange(n)
+            update[axis] = _reduce_coords(coords, starts, n)
+            if update[axis] is None:
+                break
+        else:
+            update["z"] = _reduce_raster(z, rows, cols)
+            trace.update(update)
+            reduced += 1
+    return reduced
@@ -0,0 +1,262 @@
+# export.py
+import os
+import tempfile
+
+PLOTLYJS_FILENAME = "plotly.min.js"
+
+# Formats written as vector graphics by Matplotlib
+VECTOR_FORMATS = ("svg", "svgz", "pdf", "eps", "ps")
+
+# Data artists with at least this many elements are rasterized in vector exports
+RASTERIZE_THRESHOLD = 10_000
+
+
+def ensure_plotlyjs(path):
+    """
+    Write the plotly.js bundle that ships with the installed ``plotly`` to
+    ``path`` unless a file is already there.
+
+    The file is written to a temporary name and renamed into place, so
+    parallel workers exporting into the same directory never leave a
+    partial bundle behind.
+
+    Returns
+    -------
+    str
+        ``path``.
+    """
+    if os.path.isfile(path):
+        return path
+    from plotly.offline import get_plotlyjs
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        fh.write(get_plotlyjs())
+    os.replace(tmp_path, path)
+    return path
+
+
+def is_vector_format(save_path):
+    """Whether Matplotlib writes ``save_path`` as vector graphics."""
+    from matplotlib import rcParams
+
+    fmt = None
+    if isinstance(save_path, (str, os.PathLike)):
+        fmt = os.path.splitext(os.fspath(save_path))[1][1:].lower()
+    return (fmt or rcParams["savefig.format"]) in VECTOR_FORMATS
+
+
+def _element_count(artist):
+    # Points of a line, cells of a mesh, markers of a scatter or vertices
+    # of the shapes of other collections (filled contours, fill_between)
+    from matplotlib.collections import QuadMesh
+    from matplotlib.lines import Line2D
+
+    if isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+    if isinstance(artist, QuadMesh):
+        return artist.get_coordinates()[:-1, :-1].size // 2
+    vertices = sum(len(path.vertices) for path in artist.get_paths())
+    return max(vertices, len(artist.get_offsets()))
+
+
+def rasterize_heavy_artists(fig, threshold):
+    """
+    Rasterize the data artists of ``fig`` with ``threshold`` elements or more.
+
+    Only lines and collections (scatters, meshes, hexbins, filled
+    contours, ...) on the axes are considered; text, axes, grid lines,
+    titles, notes and the legend stay vector. Rasterized artists are drawn
+    at the resolution the figure is saved with.
+
+    Returns
+    -------
+    int
+        Number of artists that were rasterized.
+    """
+    if threshold is None:
+        return 0
+    rasterized = 0
+    for ax in fig.get_axes():
+        for artist in list(ax.lines) + list(ax.collections):
+            if not artist.get_rasterized() and _element_count(artist) >= threshold:
+                artist.set_rasterized(True)
+                rasterized += 1
+    return rasterized
+
+
+def plotlyjs_script_src(plotlyjs, save_path):
+    """
+    Resolve the ``plotlyjs`` option of ``wb_plot`` for an HTML file at
+    ``save_path`` into an ``include_plotlyjs`` value for ``write_html``.
+
+    ``"inline"`` embeds the bundle. ``"directory"`` shares one
+    ``plotly.min.js`` next to the HTML files. A path ending in ``.js``
+    shares the bundle at that path (relative paths are resolved against
+    the current working directory), referenced relative to the HTML file.
+    """
+    if plotlyjs == "inline":
+        return True
+    if plotlyjs == "directory":
+        html_dir = os.path.dirname(os.path.abspath(save_path))
+        ensure_plotlyjs(os.path.join(html_dir, PLOTLYJS_FILENAME))
+        return "directory"
+    if isinstance(plotlyjs, (str, os.PathLike)) and os.fspath(plotlyjs).endswith(".js"):
+        plotlyjs = os.fspath(plotlyjs)
+        ensure_plotlyjs(plotlyjs)
+        html_dir = os.path.dirname(os.path.abspath(save_path))
+        rel = os.path.relpath(os.path.abspath(plotlyjs), html_dir)
+        # A URL, so always forward slashes
+        return rel.replace(os.sep, "/")
+    raise ValueError(
+        f"Unknown plotlyjs {plotlyjs!r}. Must be 'inline', 'directory' or a path ending in '.js'."
+    )
+
+
+# Arrays shorter than this are cheaper to repeat than to reference
+MIN_SHARED_LENGTH = 8
+
+_REF_KEY = "__wb_ref__"
+
+_REPORT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+{plotlyjs}
+<style>
+body {{ margin: 0; background: white; }}
+.wb-chart {{ margin: 0 auto 32px auto; }}
+</style>
+</head>
+<body>
+{divs}
+<script type="text/javascript">
+(function () {{
+  var arrays = {arrays};
+  var figures = {figures};
+  function resolve(node) {{
+    if (Array.isArray(node)) {{
+      for (var i = 0; i < node.length; i++) node[i] = resolve(node[i]);
+      return node;
+    }}
+    if (node !== null && typeof node === "object") {{
+      if ("{ref}" in node) return arrays[node["{ref}"]];
+      for (var key in node) node[key] = resolve(node[key]);
+    }}
+    return node;
+  }}
+  figures.forEach(function (fig, i) {{
+    fig = resolve(fig);
+    Plotly.newPlot("wb-chart-" + i, fig.data, fig.layout, {{}});
+  }});
+}})();
+</script>
+</body>
+</html>
+"""
+
+
+def _is_array(value):
+    # Data arrays as they appear in Figure.to_plotly_json(): lists/tuples of
+    # scalars or nested lists, or NumPy arrays encoded as typed arrays
+    if isinstance(value, dict):
+        return "bdata" in value and "dtype" in value
+    if isinstance(value, (list, tuple)):
+        return len(value) >= MIN_SHARED_LENGTH and not any(isinstance(v, dict) for v in value)
+    return False
+
+
+def _ref(value, table, shared):
+    # Reference to ``value`` in ``shared``; equal values (compared by their
+    # JSON) are stored once
+    from plotly.io.json import to_json_plotly
+
+    encoded = to_json_plotly(value)
+    index = table.get(encoded)
+    if index is None:
+        index = table[encoded] = len(shared)
+        shared.append(encoded)
+    return {_REF_KEY: index}
+
+
+def _share_arrays(node, table, arrays):
+    # Replace data arrays with references into ``arrays``
+    if _is_array(node):
+        return _ref(node, table, arrays)
+    if isinstance(node, dict):
+        return {key: _share_arrays(value, table, arrays) for key, value in node.items()}
+    if isinstance(node, (list, tuple)):
+        return [_share_arrays(value, table, arrays) for value in node]
+    return node
+
+
+def write_html_report(figs, path, title="", plotlyjs="inline"):
+    """
+    Write several Plotly figures into one self-contained HTML page.
+
+    plotly.js is included once for the whole page, and data arrays that
+    appear in more than one figure (shared years, country lists, ...) are
+    stored once and referenced by each figure. The figures' templates are
+    deduplicated the same way. The page is rendered and written in a single
+    pass.
+
+    Parameters
+    ----------
+    figs : sequence of plotly.graph_objects.Figure or dict
+        Figures in page order, e.g. those returned by ``wb_plot``-decorated
+        functions with ``backend="plotly"``.
+    path : str or Path
+        Output HTML file.
+    title : str, optional
+        Page title.
+    plotlyjs : {"inline", "directory"} or str, default="inline"
+        How the page loads plotly.js; see the ``plotlyjs`` option of
+        :func:`~wbpyplot.wb_plot`.
+
+    Returns
+    -------
+    str
+        ``path``.
+    """
+    import html
+
+    from plotly.io.json import to_json_plotly
+
+    path = os.fspath(path)
+    table, arrays, figures = {}, [], []
+    for fig in figs:
+        fig_dict = fig if isinstance(fig, dict) else fig.to_plotly_json()
+        layout = dict(fig_dict.get("layout", {}))
+        shared = {"data": _share_arrays(fig_dict.get("data", []), table, arrays)}
+        template = layout.pop("template", None)
+        shared["layout"] = _share_arrays(layout, table, arrays)
+        if template is not None:
+            # Every wb_plot figure carries the same template; store it once too
+            shared["layout"]["template"] = _ref(template, table, arrays)
+        figures.append(to_json_plotly(shared))
+
+    include = plotlyjs_script_src(plotlyjs, path)
+    if include is True:
+        from plotly.offline import get_plotlyjs
+
+        script = f'<script type="text/javascript">{get_plotlyjs()}</script>'
+    else:
+        src = PLOTLYJS_FILENAME if include == "directory" else include
+        script = f'<script charset="utf-8" src="{html.escape(src)}"></script>'
+
+    page = _REPORT_TEMPLATE.format(
+        title=html.escape(title or ""),
+        plotlyjs=script,
+        divs="\n".join(f'<div id="wb-chart-{i}" class="wb-chart"></div>' for i in range(len(figures))),
+        arrays="[" + ",".join(arrays) + "]",
+        figures="[" + ",".join(figures) + "]",
+        ref=_REF_KEY,
+    )
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(page)
+    return path
@@ -1,4 +1,20 @@
 import textwrap
+import threading
+from collections import OrderedDict, namedtuple
+
+from matplotlib import font_manager
+
+# Chrome layouts (titles, notes, margins) keyed by everything that shapes them
+LAYOUT_CACHE_SIZE = 256
+_layout_cache = OrderedDict()
+
+# Text extents shared by every measurement in the package, keyed by what
+# determines the rendered size of a string
+TextExtentCacheInfo = namedtuple("TextExtentCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+_text_extent_cache = OrderedDict()
+_text_extent_maxsize = 4096
+_text_extent_stats = {"hits": 0, "misses": 0}
+_text_extent_lock = threading.Lock()
 
 
 def px_to_fig_frac(px, fig, axis="y"):
@@ -11,15 +27,138 @@ def wrap_text(text, max_chars=80):
     return textwrap.fill(text, width=max_chars)
 
 
-def render_title_subtitle_note(fig, title, subtitle, note, wb_font_sizes, wb_spacing):
+def get_text_renderer(fig):
+    # Agg-based canvases hand out their renderer without rasterizing anything;
+    # other canvases fall back to Matplotlib's own renderer lookup.
+    canvas = fig.canvas
+    if hasattr(canvas, "get_renderer"):
+        return canvas.get_renderer()
+    return fig._get_renderer()
+
+
+def measure_text(artist, renderer):
+    """
+    Return the (width, height) in pixels of a text artist.
+
+    The extent comes from the renderer's text-layout metrics, so no
+    ``fig.canvas.draw()`` is needed before or after adding the artist.
+    Results are shared through a process-wide LRU cache keyed by text, font
+    size, weight, line spacing, rotation, dpi and font file; see
+    :func:`text_extent_cache_info`.
+    """
+    fontprops = artist.get_fontproperties()
+    key = (
+        artist.get_text(),
+        fontprops.get_size_in_points(),
+        fontprops.get_weight(),
+        artist.get_linespacing(),
+        artist.get_rotation(),
+        artist.figure.dpi,
+        font_manager.findfont(fontprops),
+    )
+    with _text_extent_lock:
+        extent = _text_extent_cache.get(key)
+        if extent is not None:
+            _text_extent_cache.move_to_end(key)
+            _text_extent_stats["hits"] += 1
+            return extent
+
+    bbox = artist.get_window_extent(renderer=renderer)
+    extent = (bbox.width, bbox.height)
+    with _text_extent_lock:
+        _text_extent_stats["misses"] += 1
+        _text_extent_cache[key] = extent
+        while len(_text_extent_cache) > _text_extent_maxsize:
+            _text_extent_cache.popitem(last=False)
+    return extent
+
+
+def text_extent_cache_info():
+    """Return hits, misses, maxsize and current size of the text-extent cache."""
+    with _text_extent_lock:
+        return TextExtentCacheInfo(
+            _text_extent_stats["hits"],
+            _text_extent_stats["misses"],
+            _text_extent_maxsize,
+            len(_text_extent_cache),
+        )
+
+
+def set_text_extent_cache_size(maxsize):
+    """Set how many text extents are kept (least recently used are dropped)."""
+    global _text_extent_maxsize
+    with _text_extent_lock:
+        _text_extent_maxsize = max(0, int(maxsize))
+        while len(_text_extent_cache) > _text_extent_maxsize:
+            _text_extent_cache.popitem(last=False)
+
+
+def clear_text_extent_cache():
+    """Empty the text-extent cache and reset its statistics."""
+    with _text_extent_lock:
+        _text_extent_cache.clear()
+        _text_extent_stats["hits"] = 0
+        _text_extent_stats["misses"] = 0
+
+
+def add_text(fig, text_specs, x, y, text, **kwargs):
+    # Record each figure text so a cached layout can recreate it unmeasured
+    if text_specs is not None:
+        text_specs.append((x, y, text, kwargs))
+    return fig.text(x, y, text, **kwargs)
+
+
+def add_text_specs(fig, text_specs):
+    for x, y, text, kwargs in text_specs:
+        fig.text(x, y, text, **kwargs)
+
+
+def layout_cache_key(fig, *parts):
+    """
+    Build a hashable layout-cache key from the figure size in pixels, its dpi
+    and any other values that shape the layout (lists become tuples).
+    """
+
+    def freeze(value):
+        if isinstance(value, (list, tuple)):
+            return tuple(freeze(v) for v in value)
+        if isinstance(value, dict):
+            return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+        return value
+
+    width_in, height_in = fig.get_size_inches()
+    return (float(width_in * fig.dpi), float(height_in * fig.dpi), float(fig.dpi)) + freeze(parts)
+
+
+def get_cached_layout(key):
+    layout = _layout_cache.get(key)
+    if layout is not None:
+        _layout_cache.move_to_end(key)
+    return layout
+
+
+def store_layout(key, layout):
+    _layout_cache[key] = layout
+    _layout_cache.move_to_end(key)
+    while len(_layout_cache) > LAYOUT_CACHE_SIZE:
+        _layout_cache.popitem(last=False)
+
+
+def clear_layout_cache():
+    """Forget all cached title/note/margin layouts."""
+    _layout_cache.clear()
+
+
+def render_title_subtitle_note(fig, title, subtitle, note, wb_font_sizes, wb_spacing, text_specs=None):
     spacing_frac = {k: px_to_fig_frac(v, fig, "y") for k, v in wb_spacing.items()}
     margin_x_frac = px_to_fig_frac(wb_spacing["m"], fig, "x")
-    fig.canvas.draw()
-    renderer = fig.canvas.get_renderer()
+    renderer = get_text_renderer(fig)
     y_pos = 1.0 - spacing_frac["xl"]
 
     if title:
-        title_text = fig.text(
+        title_text = add_text(
+            fig,
+            text_specs,
             margin_x_frac,
             y_pos,
             wrap_text(title, 80),
@@ -30,13 +169,14 @@ def render_title_subtitle_note(fig, title, subtitle, note, wb_font_sizes, wb_spa
             va="top",
             linespacing=1.2,
         )
-        fig.canvas.draw()
-        bbox = title_text.get_window_extent(renderer=renderer)
-        title_height_frac = bbox.height / (fig.get_size_inches()[1] * fig.dpi)
+        _, title_height = measure_text(title_text, renderer)
+        title_height_frac = title_height / (fig.get_size_inches()[1] * fig.dpi)
         y_pos -= title_height_frac + spacing_frac["xxs"]
 
     if subtitle:
-        subtitle_text = fig.text(
+        subtitle_text = add_text(
+            fig,
+            text_specs,
             margin_x_frac,
             y_pos,
             wrap_text(subtitle, 100),
@@ -47,9 +187,8 @@ def render_title_subtitle_note(fig, title, subtitle, note, wb_font_sizes, wb_spa
             va="top",
             linespacing=1.2,
         )
-        fig.canvas.draw()
-        bbox = subtitle_text.get_window_extent(renderer=renderer)
-        subtitle_height_frac = bbox.height / (fig.get_size_inches()[1] * fig.dpi)
+        _, subtitle_height = measure_text(subtitle_text, renderer)
+        subtitle_height_frac = subtitle_height / (fig.get_size_inches()[1] * fig.dpi)
         y_pos -= subtitle_height_frac + spacing_frac["s"]
 
     notes_to_render = []
@@ -67,7 +206,9 @@ def render_title_subtitle_note(fig, title, subtitle, note, wb_font_sizes, wb_spa
 
     for label, text in notes_to_render:
         x_start = margin_x_frac
-        label_artist = fig.text(
+        label_artist = add_text(
+            fig,
+            text_specs,
             x_start,
             y_note,
             label + " ",
@@ -78,11 +219,12 @@ def render_title_subtitle_note(fig, title, subtitle, note, wb_font_sizes, wb_spa
             va="bottom",
             linespacing=1.5,  # 150% line height per style guide
         )
-        fig.canvas.draw()
-        bbox_label = label_artist.get_window_extent(renderer=renderer)
-        label_width_frac = bbox_label.width / (fig.get_size_inches()[0] * fig.dpi)
+        label_width, _ = measure_text(label_artist, renderer)
+        label_width_frac = label_width / (fig.get_size_inches()[0] * fig.dpi)
 
-        note_artist = fig.text(
+        note_artist = add_text(
+            fig,
+            text_specs,
             x_start + label_width_frac,
             y_note,
             wrap_text(text, 120),
@@ -93,9 +235,8 @@ def render_title_subtitle_note(fig, title, subtitle, note, wb_font_sizes, wb_spa
             va="bottom",
             linespacing=1.5,  # 150% line height per style guide
         )
-        fig.canvas.draw()
-        bbox_note = note_artist.get_window_extent(renderer=renderer)
-        note_height_frac = bbox_note.height / (fig.get_size_inches()[1] * fig.dpi)
+        _, note_height = measure_text(note_artist, renderer)
+        note_height_frac = note_height / (fig.get_size_inches()[1] * fig.dpi)
 
         y_note += note_height_frac + line_spacing_frac
 
@@ -106,6 +247,27 @@ def render_title_subtitle_note(fig, title, subtitle, note, wb_font_sizes, wb_spa
     return y_pos, bottom_space, margin_x_frac
 
 
+def render_top_ylabel(fig, ylabel_text, x, y_top, wb_font_sizes, wb_spacing, text_specs=None):
+    # Line charts show the Y-axis title at the top, underneath the subtitle;
+    # returns the new top of the plot area.
+    ylabel_artist = add_text(
+        fig,
+        text_specs,
+        x,
+        y_top,
+        ylabel_text,
+        fontsize=wb_font_sizes["s"],
+        fontweight="semibold",
+        color="#111111",
+        ha="left",
+        va="top",
+        linespacing=1.2,
+    )
+    _, ylabel_height = measure_text(ylabel_artist, get_text_renderer(fig))
+    ylabel_height_frac = ylabel_height / (fig.get_size_inches()[1] * fig.dpi)
+    return y_top - (ylabel_height_frac + px_to_fig_frac(wb_spacing["s"], fig, "y"))
+
+
 def compute_total_bottom_margin(fig, axs, handles, note, note_margin_frac, spacing):
     has_xlabel = any(ax.get_xlabel() for ax in axs)
     xlabel_spacing = (
@@ -1,10 +1,9 @@
 from matplotlib.lines import Line2D
-from matplotlib.collections import PathCollection
+from matplotlib.collections import PathCollection, PolyCollection
 import matplotlib.font_manager as font_manager
 
 
 def render_legend_below_plot(fig, handles, labels, spacing, y_position, x_position=None, legend_title=None, font_sizes=None):
-    fig.canvas.draw()
     spacing_y = spacing["xl"] / (fig.get_size_inches()[1] * fig.dpi)
     labels = [label.upper() for label in labels]
 
@@ -14,6 +13,9 @@ def render_legend_below_plot(fig, handles, labels, spacing, y_position, x_positi
             color = h.get_color()
         elif isinstance(h, PathCollection):
             color = h.get_facecolor()[0] if len(h.get_facecolor()) else "#CED4DE"
+        elif isinstance(h, PolyCollection) and h.get_array() is not None:
+            # Density layer: a dark tone from its sequential palette
+            color = h.get_cmap()(0.75)
         else:
             color = "#CED4DE"
 
@@ -0,0 +1,208 @@
+# live.py
+import numpy as np
+from matplotlib.collections import PathCollection
+from matplotlib.container import BarContainer
+
+from .axis import AxisDecorations, add_bar_labels, add_zero_line, is_horizontal_bar, tidy_numeric_ticks
+from .decorator import FigureScope
+from .downsample import downsample_lines
+from .theme import wb_theme
+
+
+class LiveFigure(FigureScope):
+    """
+    Styled figure returned by ``wb_plot(live=True)`` whose data can be
+    replaced without rendering it again.
+
+    The titles, notes, legend and margins computed by the first render are
+    kept; :meth:`update` swaps line, scatter and bar data in place and
+    redoes only what depends on the data: axis limits, tick formatting,
+    bar value labels and the zero line. When the axis limits do not change
+    the new data is blitted onto a cached background instead of redrawing
+    the figure.
+
+    Like the ``FigureScope`` of ``pyplot=False`` renders it can be used as
+    a context manager that releases the figure on exit.
+
+    .. code-block:: python
+
+        live = plot_prices(df)
+        while True:
+            df = fetch_prices()
+            live.update({"Brent": (df.date, df.brent), "WTI": (df.date, df.wti)})
+    """
+
+    def __init__(self, fig, axs, chart_types, decorations, font_sizes, bar_labels=True, downsample=False):
+        super().__init__(fig, axs)
+        self.chart_types = dict(chart_types)
+        self.decorations = dict(decorations)
+        self.font_sizes = font_sizes
+        self.bar_labels = bar_labels
+        self.downsample = downsample
+        self._backgrounds = {}
+
+    def series(self, ax=0):
+        """
+        The data artists of ``ax`` that :meth:`update` can change, in order:
+        lines, then scatters, then bar containers.
+        """
+        ax = self._axes(ax)
+        zero_line = self.decorations.get(ax, AxisDecorations(None, [])).zero_line
+        lines = [line for line in ax.get_lines() if line is not zero_line]
+        scatters = [col for col in ax.collections if isinstance(col, PathCollection)]
+        bars = [c for c in ax.containers if isinstance(c, BarContainer)]
+        return lines + scatters + bars
+
+    def update(self, data, ax=0, draw=True):
+        """
+        Replace the data of series on one axes and redraw.
+
+        Parameters
+        ----------
+        data : dict
+            New data keyed by series label or by index into :meth:`series`.
+            Lines take ``(x, y)`` or just ``y`` (same length as the current
+            x); scatters take ``(x, y)`` or ``(x, y, c)`` for color-mapped
+            points; bars take their new values (heights, or widths for
+            horizontal bars).
+        ax : int or matplotlib.axes.Axes, default=0
+            Axes holding the series, as an index into ``axs`` or the axes
+            itself.
+        draw : bool, default=True
+            Whether to redraw now. Pass ``False`` to batch several updates,
+            then call :meth:`draw`.
+
+        Raises
+        ------
+        KeyError
+            If a key matches no series on the axes.
+        """
+        ax = self._axes(ax)
+        series = self.series(ax)
+        by_label = {artist.get_label(): artist for artist in series}
+        for key, values in data.items():
+            if isinstance(key, (int, np.integer)):
+                artist = series[key]
+            elif key in by_label:
+                artist = by_label[key]
+            else:
+                raise KeyError(f"No series labelled {key!r} on this axes.")
+            _set_series_data(ax, artist, values)
+
+        limits_before = tuple(ax.viewLim.bounds)
+        # Bar labels and the zero line take their defaults from the theme
+        with wb_theme():
+            self._refresh(ax)
+        if draw:
+            self.draw(ax, limits_changed=tuple(ax.viewLim.bounds) != limits_before)
+
+    def draw(self, ax=None, limits_changed=True):
+        """
+        Redraw the figure, blitting only ``ax``'s data when its limits did
+        not change and the canvas supports it.
+        """
+        canvas = self.fig.canvas
+        axes = self._axes(ax) if ax is not None else None
+        # Ticks added for new limits are created while drawing
+        with wb_theme():
+            if axes is None or limits_changed or not self._blit(axes):
+                canvas.draw()
+        canvas.flush_events()
+
+    def _axes(self, ax):
+        if isinstance(ax, (int, np.integer)):
+            return self.axs[ax]
+        return ax
+
+    def _refresh(self, ax):
+        # Everything on ``ax`` that follows from the data; titles, notes,
+        # legend and margins are left as they are
+        chart_type = self.chart_types.get(ax)
+        old = self.decorations.get(ax, AxisDecorations(None, []))
+        if old.zero_line is not None:
+            old.zero_line.remove()
+        for text in old.bar_labels:
+            text.remove()
+        if self.downsample:
+            downsample_lines([ax], self.downsample)
+
+        ax.relim()
+        # relim() skips collections; scatters count towards the limits too
+        for col in ax.collections:
+            if isinstance(col, PathCollection) and len(col.get_offsets()):
+                ax.update_datalim(col.get_offsets())
+        ax.autoscale_view()
+
+        zero_line = add_zero_line(ax, chart_type)
+        value_labels = []
+        if chart_type == "bar" and self.bar_labels:
+            value_labels = add_bar_labels(ax, self.font_sizes)
+        self.decorations[ax] = AxisDecorations(zero_line, value_labels)
+        tidy_numeric_ticks(ax, max_ticks=5, chart_type=chart_type)
+
+    def _dynamic_artists(self, ax):
+        decorations = self.decorations.get(ax, AxisDecorations(None, []))
+        artists = []
+        for artist in self.series(ax):
+            artists.extend(artist.patches if isinstance(artist, BarContainer) else [artist])
+        if decorations.zero_line is not None:
+            artists.append(decorations.zero_line)
+        return sorted(artists, key=lambda a: a.get_zorder())
+
+    def _blit(self, ax):
+        # Restore the axes without its data and draw the data on top. Bar
+        # value labels can sit outside the axes, so those charts are
+        # redrawn in full.
+        canvas = self.fig.canvas
+        if not canvas.supports_blit or self.decorations.get(ax, AxisDecorations(None, [])).bar_labels:
+            return False
+        key = (canvas.get_width_height(), tuple(ax.bbox.bounds), tuple(ax.viewLim.bounds))
+        artists = self._dynamic_artists(ax)
+        cached = self._backgrounds.get(ax)
+        if cached is None or cached[0] != key:
+            # One draw with the data hidden gives the background
+            visible = [a for a in artists if a.get_visible()]
+            for artist in visible:
+                artist.set_visible(False)
+            try:
+                canvas.draw()
+                cached = self._backgrounds[ax] = (key, canvas.copy_from_bbox(ax.bbox))
+            finally:
+                for artist in visible:
+                    artist.set_visible(True)
+        canvas.restore_region(cached[1])
+        for artist in artists:
+            if artist.get_visible():
+                ax.draw_artist(artist)
+        canvas.blit(ax.bbox)
+        return True
+
+    def close(self):
+        self._backgrounds = {}
+        super().close()
+
+
+def _set_series_data(ax, artist, values):
+    if isinstance(artist, BarContainer):
+        values = np.asarray(values, dtype=float)
+        if len(values) != len(artist.patches):
+            raise ValueError(f"Expected {len(artist.patches)} bar values, got {len(values)}.")
+        orientation = getattr(artist, "orientation", None)
+        horizontal = orientation == "horizontal" if orientation is not None else is_horizontal_bar(ax)
+        for patch, value in zip(artist.patches, values):
+            if horizontal:
+                patch.set_width(value)
+            else:
+                patch.set_height(value)
+        # bar_label() reads the values from here
+        artist.datavalues = values
+    elif isinstance(artist, PathCollection):
+        x, y, *c = values
+        # Dates and other unit-aware values are converted like in ax.scatter()
+        artist.set_offsets(np.column_stack([ax.convert_xunits(x), ax.convert_yunits(y)]))
+        if c:
+            artist.set_array(np.asarray(c[0]))
+    elif isinstance(values, tuple):
+        artist.set_data(*values)
+    else:
+        artist.set_ydata(values)
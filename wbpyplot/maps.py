@@ -0,0 +1,305 @@
+# maps.py
+import hashlib
+import operator
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+# Processed geometry arrays kept across renders, keyed by the content of the
+# source geometries and how they were processed
+GEOMETRY_CACHE_SIZE = 64
+_geometry_cache = OrderedDict()
+_geometry_lock = threading.Lock()
+
+# Content hashes of the geometry arrays passed to prepare_map, keyed by the
+# array's id so repeat calls skip hashing. Entries are dropped when their
+# array is garbage collected.
+_source_hashes = {}
+
+# Simplification tolerance in output pixels
+SIMPLIFY_TOLERANCE_PX = 0.5
+
+
+def _cached(key, compute):
+    with _geometry_lock:
+        value = _geometry_cache.get(key)
+        if value is not None:
+            _geometry_cache.move_to_end(key)
+            return value
+    value = compute()
+    with _geometry_lock:
+        _geometry_cache[key] = value
+        while len(_geometry_cache) > GEOMETRY_CACHE_SIZE:
+            _geometry_cache.popitem(last=False)
+    return value
+
+
+def clear_geometry_cache():
+    """Forget all cached reprojected and simplified geometries."""
+    with _geometry_lock:
+        _geometry_cache.clear()
+        _source_hashes.clear()
+
+
+def geometry_hash(geometries):
+    """Content hash of a geometry array or GeoSeries (its WKB)."""
+    import shapely
+
+    digest = hashlib.blake2b(digest_size=16)
+    for wkb in shapely.to_wkb(np.asarray(geometries, dtype=object)):
+        digest.update(b"\x00" if wkb is None else wkb)
+    return digest.hexdigest()
+
+
+def _forget_source(key, ref):
+    # Weakref callback: drop the entry unless its id was reused since. It
+    # can run while _geometry_lock is held (an evicted array is freed), so
+    # it does not take the lock; losing a race only costs a rehash.
+    entry = _source_hashes.get(key)
+    if entry is not None and entry[0] is ref:
+        _source_hashes.pop(key, None)
+
+
+def _source_hash(geometries):
+    # geometry_hash() of ``geometries``, computed once per array. Older
+    # pandas versions can replace geometries of an array in place, so a hit
+    # also checks that the array still holds the same geometry objects,
+    # which compares pointers instead of hashing coordinates.
+    key = id(geometries)
+    current = np.asarray(geometries, dtype=object)
+    with _geometry_lock:
+        entry = _source_hashes.get(key)
+    if entry is not None:
+        ref, members, digest = entry
+        if ref() is geometries and len(members) == len(current) and all(map(operator.is_, members, current)):
+            return digest
+
+    digest = geometry_hash(current)
+    try:
+        ref = weakref.ref(geometries, lambda ref, key=key: _forget_source(key, ref))
+    except TypeError:
+        # Not weak-referenceable (e.g. a plain list): hash every time
+        return digest
+    with _geometry_lock:
+        _source_hashes[key] = (ref, current.copy(), digest)
+    return digest
+
+
+def _crs_key(crs):
+    if crs is None:
+        return None
+    from pyproj import CRS
+
+    return CRS.from_user_input(crs).to_wkt()
+
+
+def _with_geometry(gdf, geometries, crs):
+    # Shallow copy of ``gdf`` with its active geometry column replaced
+    import geopandas
+
+    result = gdf.copy(deep=False)
+    result[gdf.geometry.name] = geopandas.GeoSeries(geometries, index=gdf.index, crs=crs)
+    return result
+
+
+def _simplify(geometries, tolerance):
+    # Each geometry stays valid (no self-intersections, no collapsed
+    # rings); shared borders move by at most the tolerance, i.e. below a
+    # pixel
+    import shapely
+
+    return shapely.simplify(np.asarray(geometries, dtype=object), tolerance, preserve_topology=True)
+
+
+def prepare_map(gdf, crs=None, width=1200, ax=None, tolerance_px=SIMPLIFY_TOLERANCE_PX):
+    """
+    Reproject and simplify a GeoDataFrame for drawing at the output size.
+
+    A 1200 px wide map cannot show detail finer than a pixel, yet
+    high-resolution boundaries carry far more. The geometries are
+    reprojected to ``crs`` and simplified with a topology-preserving
+    Douglas-Peucker to ``tolerance_px`` of a pixel, so the drawn map looks
+    the same.
+    Both steps are cached for the whole process, keyed by the content of
+    the geometries, the CRS and the tolerance, so every later map of the
+    same boundaries skips them. The content is hashed once per geometry
+    array, so drawing the same GeoDataFrame again costs next to nothing.
+
+    Parameters
+    ----------
+    gdf : geopandas.GeoDataFrame
+        Data to map; it is not modified.
+    crs : optional
+        Target CRS, anything ``pyproj.CRS.from_user_input`` accepts.
+        ``None`` keeps the current CRS.
+    width : int, default=1200
+        Width of the map in pixels, e.g. the ``width`` passed to
+        ``wb_plot``.
+    ax : matplotlib.axes.Axes, optional
+        Axes the map is drawn on; its width in pixels is used instead of
+        ``width``.
+    tolerance_px : float or None, default=0.5
+        Largest allowed deviation from the original boundaries, in pixels.
+        ``None`` only reprojects.
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+        A shallow copy of ``gdf`` with processed geometries.
+
+    Examples
+    --------
+    >>> @wb_plot(title="GDP per capita", palette="wb_seq_monochrome_blue")
+    ... def gdp_map(axs):
+    ...     world = prepare_map(countries, crs="EPSG:8857", ax=axs[0])
+    ...     world.plot(column="gdp", ax=axs[0])
+    """
+    height = None
+    if ax is not None:
+        bbox = ax.get_window_extent()
+        width, height = bbox.width, bbox.height
+    source = _source_hash(gdf.geometry.values)
+    source_crs = _crs_key(gdf.crs)
+    target_crs = source_crs if crs is None else _crs_key(crs)
+
+    def reproject():
+        geometries = gdf.geometry.values
+        if target_crs == source_crs:
+            return geometries
+        return gdf.geometry.to_crs(crs).values
+
+    geometries = _cached(("to_crs", source, source_crs, target_crs), reproject)
+
+    if tolerance_px:
+        minx, miny, maxx, maxy = geometries.total_bounds
+        # Map units per output pixel; the map is fitted to the axes, so
+        # without their height the width gives a lower bound
+        unit_per_px = (maxx - minx) / max(1.0, float(width))
+        if height:
+            unit_per_px = max(unit_per_px, (maxy - miny) / max(1.0, float(height)))
+        tolerance = tolerance_px * unit_per_px
+        if np.isfinite(tolerance) and tolerance > 0:
+            geometries = _cached(
+                ("simplify", source, source_crs, target_crs, float(tolerance)),
+                lambda: _simplify(geometries, tolerance),
+            )
+    return _with_geometry(gdf, geometries, crs if crs is not None else gdf.crs)
+
+
+# Plotly trace types that draw GeoJSON features
+GEOJSON_TRACE_TYPES = ("choropleth", "choroplethmap", "choroplethmapbox")
+
+
+def _geojson_hash(geojson):
+    # marshal serializes plain dicts/lists/floats an order of magnitude
+    # faster than json; values it cannot encode (NumPy scalars, ...) fall
+    # back to json
+    import json
+    import marshal
+
+    try:
+        encoded = marshal.dumps(geojson)
+    except ValueError:
+        encoded = json.dumps(geojson, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _geojson_geometries(geojson):
+    # The geometry dicts of a FeatureCollection, Feature or bare geometry
+    kind = geojson.get("type")
+    if kind == "FeatureCollection":
+        return [feature.get("geometry") for feature in geojson.get("features", [])]
+    if kind == "Feature":
+        return [geojson.get("geometry")]
+    return [geojson]
+
+
+def _with_geojson_geometries(geojson, geometries):
+    # Copy of ``geojson`` with its geometries replaced; properties and ids are kept
+    kind = geojson.get("type")
+    if kind == "FeatureCollection":
+        features = [dict(feature, geometry=geometry) for feature, geometry in zip(geojson["features"], geometries)]
+        return dict(geojson, features=features)
+    if kind == "Feature":
+        return dict(geojson, geometry=geometries[0])
+    return geometries[0]
+
+
+def _process_geojson(geojson, tolerance_px, width):
+    import shapely
+    from shapely.geometry import mapping, shape
+
+    raw = _geojson_geometries(geojson)
+    present = [i for i, g in enumerate(raw) if g]
+    if not present:
+        return geojson
+    geometries = np.array([shape(raw[i]) for i in present], dtype=object)
+    minx, _, maxx, _ = shapely.total_bounds(geometries)
+    # Degrees per pixel if the features fill the map's width; a lower bound
+    # otherwise
+    tolerance = tolerance_px * (maxx - minx) / max(1.0, float(width))
+    if not np.isfinite(tolerance) or tolerance <= 0:
+        return geojson
+
+    simplified = _simplify(geometries, tolerance)
+    # Quantize to a decimal grid no coarser than the tolerance, which keeps
+    # every coordinate short in the HTML
+    decimals = max(0, int(np.ceil(-np.log10(tolerance))))
+    geometries = shapely.set_precision(simplified, 10.0**-decimals)
+    geometries = shapely.transform(geometries, lambda coords: np.round(coords, decimals))
+    # Features smaller than a grid cell collapse to empty geometries; small
+    # islands and enclaves still get drawn, so keep them unquantized
+    collapsed = shapely.is_empty(geometries) & ~shapely.is_empty(simplified)
+    geometries[collapsed] = simplified[collapsed]
+
+    processed = list(raw)
+    for i, geometry in zip(present, geometries):
+        processed[i] = mapping(geometry)
+    return _with_geojson_geometries(geojson, processed)
+
+
+def simplify_geojson(geojson, width=1200, tolerance_px=SIMPLIFY_TOLERANCE_PX):
+    """
+    Simplify and quantize GeoJSON in longitude/latitude for a map ``width`` pixels wide.
+
+    Geometries are simplified with a topology-preserving Douglas-Peucker
+    to ``tolerance_px`` of a pixel and their coordinates rounded to the
+    fewest decimals that keep that precision. Results are cached for the
+    whole process by the content of ``geojson``, so the same boundaries
+    used by several charts are processed once and shared.
+
+    Returns
+    -------
+    dict
+        The processed GeoJSON; ``geojson`` itself is not modified.
+    """
+    key = ("geojson", _geojson_hash(geojson), float(tolerance_px), float(width))
+    return _cached(key, lambda: _process_geojson(geojson, tolerance_px, width))
+
+
+def simplify_trace_geojson(fig, simplify, width):
+    """
+    Apply :func:`simplify_geojson` to the GeoJSON of every choropleth trace
+    of ``fig`` for the ``simplify_geojson`` option of ``wb_plot``.
+
+    Returns
+    -------
+    int
+        Number of traces whose GeoJSON was replaced.
+    """
+    if not simplify:
+        return 0
+    tolerance_px = SIMPLIFY_TOLERANCE_PX if simplify is True else float(simplify)
+    replaced = 0
+    for trace in fig.data:
+        if trace.type not in GEOJSON_TRACE_TYPES:
+            continue
+        geojson = trace.geojson
+        # GeoJSON given by URL is fetched by the browser
+        if not isinstance(geojson, dict):
+            continue
+        trace.geojson = simplify_geojson(geojson, width=width, tolerance_px=tolerance_px)
+        replaced += 1
+    return replaced
@@ -1,3 +1,19 @@
+import numpy as np
+
+SPECIAL_UNITS = {"watt": "w", "tons": "t", "bits": "b", "bytes": "B"}
+
+
+def _unit_suffix(suffix, unit):
+    # Combine the K/M/B scale suffix with the unit (special units become kW, MB, Gt, ...)
+    if unit in SPECIAL_UNITS:
+        suffix = suffix.replace("B", f"G{SPECIAL_UNITS[unit]}")
+        suffix = suffix.replace("M", f"M{SPECIAL_UNITS[unit]}")
+        suffix = suffix.replace("K", f"K{SPECIAL_UNITS[unit]}")
+    elif unit:
+        suffix = suffix + unit
+    return suffix
+
+
 def format_number(value, unit=None, is_percent=False, is_currency=False):
     if not isinstance(value, (int, float)):
         return str(value)
@@ -13,8 +29,6 @@ def format_number(value, unit=None, is_percent=False, is_currency=False):
     suffix = ""
     scaled_val = value
 
-    special_units = {"watt": "w", "tons": "t", "bits": "b", "bytes": "B"}
-
     if abs_val >= 1_000_000_000:
         scaled_val = value / 1_000_000_000
         suffix = "B"
@@ -25,12 +39,7 @@ def format_number(value, unit=None, is_percent=False, is_currency=False):
         scaled_val = value / 1_000
         suffix = "K"
 
-    if unit in special_units:
-        suffix = suffix.replace("B", f"G{special_units[unit]}")
-        suffix = suffix.replace("M", f"M{special_units[unit]}")
-        suffix = suffix.replace("K", f"K{special_units[unit]}")
-    elif unit:
-        suffix = suffix + unit
+    suffix = _unit_suffix(suffix, unit)
 
     abs_scaled = abs(scaled_val)
 
@@ -55,3 +64,98 @@ def format_number(value, unit=None, is_percent=False, is_currency=False):
         number_str = f"{number_str}%"
 
     return f"{number_str}{suffix}"
+
+
+# Float64 represents every integer up to 2**53 exactly; larger integers keep
+# the scalar path so scaling matches Python's int division.
+_MAX_EXACT_INT = 2**53
+
+
+def format_numbers(values, unit=None, is_percent=False, is_currency=False):
+    """
+    Vectorized :func:`format_number` for NumPy arrays and array-likes.
+
+    Applies exactly the same rules as ``format_number`` to every element
+    (year passthrough, K/M/B scaling, special units, decimals by magnitude,
+    thousands separators). Elements of integer and boolean arrays are
+    formatted like Python ints and elements of float arrays like Python
+    floats; any other dtype falls back to ``format_number`` per element.
+    Each distinct value is formatted once, so columns with repeated values
+    are cheap.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of strings with the same shape as ``values``.
+    """
+    arr = np.asarray(values)
+    shape = arr.shape
+    flat = arr.ravel()
+    if flat.size == 0:
+        return np.empty(shape, dtype=str)
+
+    kind = flat.dtype.kind
+    if kind not in "biuf":
+        out = [format_number(v, unit, is_percent, is_currency) for v in flat.tolist()]
+        return np.array(out, dtype=str).reshape(shape)
+
+    # Format distinct values only. Float bits (not values) are compared so
+    # that -0.0 and 0.0 stay distinct, as they format differently.
+    if kind == "f":
+        flat = flat.astype(np.float64, copy=False)
+        _, first, inverse = np.unique(flat.view(np.int64), return_index=True, return_inverse=True)
+    else:
+        _, first, inverse = np.unique(flat, return_index=True, return_inverse=True)
+    uniq = flat[first]
+
+    if kind == "f":
+        x = uniq
+        is_int = np.isfinite(x) & (x == np.floor(x))
+        scalar = ~np.isfinite(x)
+    else:
+        scalar = np.abs(uniq.astype(np.float64)) >= _MAX_EXACT_INT
+        x = uniq.astype(np.float64)
+        is_int = np.ones(x.shape, dtype=bool)
+
+    abs_val = np.abs(x)
+    year = is_int & (x >= 1000) & (x <= 2999)
+
+    # Scale tier: 0 = none, 1 = K, 2 = M, 3 = B
+    tier = np.zeros(x.shape, dtype=np.intp)
+    tier[abs_val >= 10_000] = 1
+    tier[abs_val >= 1_000_000] = 2
+    tier[abs_val >= 1_000_000_000] = 3
+    divisors = np.array([1.0, 1_000.0, 1_000_000.0, 1_000_000_000.0])
+    scaled = np.where(tier > 0, x / divisors[tier], x)
+    suffixes = np.array([_unit_suffix(s, unit) for s in ("", "K", "M", "B")], dtype=object)
+    suffix = suffixes[tier]
+
+    abs_scaled = np.abs(scaled)
+    decimals = np.where(is_int, 0, np.where(abs_scaled < 1, 2, np.where(abs_scaled < 100, 1, 0)))
+
+    number = np.full(x.shape, "", dtype=object)
+    for d in (0, 1, 2):
+        mask = (decimals == d) & ~year & ~scalar
+        if mask.any():
+            number[mask] = np.char.mod(f"%.{d}f", scaled[mask])
+
+    # Unscaled values of 1,000 and above get a thousands separator
+    comma = (suffix == "") & (abs_val >= 1000) & ~year & ~scalar
+    if comma.any():
+        number[comma] = ["{:,.0f}".format(v) for v in x[comma].tolist()]
+
+    if is_currency:
+        number = "$" + number
+    if is_percent:
+        number = number + "%"
+    formatted = number + suffix
+
+    if year.any():
+        formatted[year & ~scalar] = np.char.mod("%.0f", x[year & ~scalar])
+    if scalar.any():
+        py = uniq.tolist()
+        formatted[scalar] = [
+            format_number(py[i], unit, is_percent, is_currency) for i in np.flatnonzero(scalar)
+        ]
+
+    return formatted.astype(str)[inverse].reshape(shape)
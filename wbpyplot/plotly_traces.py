@@ -0,0 +1,222 @@
+# plotly_traces.py
+from collections import namedtuple
+
+import numpy as np
+
+TraceSummary = namedtuple(
+    "TraceSummary",
+    ["has_bar", "is_bar_horizontal", "has_choropleth", "has_legend", "is_line_chart_with_temporal_x", "first_bar"],
+)
+TraceSummary.__doc__ = """
+What the Plotly post-processing needs to know about a figure's traces,
+collected in a single pass by :func:`classify_traces`.
+"""
+
+_DATETIME_CLASS_NAMES = ("Timestamp", "datetime", "date", "Date")
+
+
+def _has_temporal_x(x):
+    # Line charts count as temporal when x is datetime-like OR numeric (e.g. years)
+    if x is None:
+        return False
+    if hasattr(x, "dtype"):
+        return np.issubdtype(x.dtype, np.datetime64) or np.issubdtype(x.dtype, np.number)
+    if isinstance(x, (list, tuple)) and len(x) > 0:
+        first_val = x[0]
+        if isinstance(first_val, (int, float, np.integer, np.floating)):
+            return True
+        class_name = first_val.__class__.__name__
+        return any(dt_type in class_name for dt_type in _DATETIME_CLASS_NAMES)
+    return False
+
+
+def classify_traces(fig):
+    """Classify ``fig.data`` in one pass; see :class:`TraceSummary`."""
+    has_bar = has_choropleth = has_legend = has_lines = False
+    is_bar_horizontal = temporal_x = False
+    first_bar = None
+    for trace in fig.data:
+        trace_type = trace.type
+        if trace_type == "bar":
+            has_bar = True
+            if first_bar is None:
+                first_bar = trace
+            if trace.orientation == "h":
+                is_bar_horizontal = True
+        elif trace_type == "choropleth":
+            has_choropleth = True
+        if trace.name:
+            has_legend = True
+        # Only treat as line chart when traces actually draw lines (mode contains "lines")
+        mode = _prop(trace, "mode")
+        if mode and "lines" in str(mode):
+            has_lines = True
+        if not temporal_x:
+            temporal_x = _has_temporal_x(_prop(trace, "x"))
+
+    is_line_chart_with_temporal_x = False
+    if has_lines:
+        # The user may also have declared a date axis
+        is_line_chart_with_temporal_x = temporal_x or fig.layout.xaxis.type in ("date", "date-time")
+
+    return TraceSummary(
+        has_bar, is_bar_horizontal, has_choropleth, has_legend, is_line_chart_with_temporal_x, first_bar
+    )
+
+
+def _bar_fmt(v):
+    if isinstance(v, (int, float)):
+        if not np.isfinite(v):
+            return ""
+        return str(int(v)) if v == int(v) else str(round(v, 2))
+    return str(v)
+
+
+def bar_value_labels(vals):
+    """
+    Value labels for bar ``vals``: integers as-is, other numbers rounded to
+    2 decimals. Numeric arrays are formatted once per distinct value and
+    returned as a NumPy string array.
+    """
+    if isinstance(vals, str) or not hasattr(vals, "__iter__"):
+        return [_bar_fmt(vals)]
+    arr = np.asarray(vals)
+    if arr.ndim == 1 and arr.dtype.kind in "iuf":
+        uniq, inverse = np.unique(arr, return_inverse=True)
+        labels = np.array([_bar_fmt(v) for v in uniq.tolist()], dtype=str)
+        # A string array skips Plotly's per-element validation
+        return labels[inverse]
+    return [_bar_fmt(v) for v in vals]
+
+
+def _hover_field(name, vals):
+    # d3-format in the browser: up to 2 decimals for numbers, as-is otherwise
+    if not isinstance(vals, str) and np.asarray(vals).dtype.kind in "biuf":
+        return f"%{{{name}:.2~f}}"
+    return f"%{{{name}}}"
+
+
+def _prop(trace, prop):
+    # Property value, or None for properties this trace type doesn't have
+    return trace[prop] if prop in trace else None
+
+
+def _is_empty(trace, prop):
+    # Fonts count as unset when no font property was given; not every
+    # trace type has them
+    if prop not in trace:
+        return False
+    value = trace[prop]
+    return value is None or not value.to_plotly_json()
+
+
+def style_traces(
+    fig,
+    summary,
+    *,
+    colorscale=None,
+    label_map=None,
+    bar_labels=True,
+    text_font=None,
+    x_title="X",
+    y_title="Y",
+):
+    """
+    Apply the World Bank trace styling to every trace of ``fig``.
+
+    Each trace is inspected once and receives a single ``update`` with all
+    of its changes: continuous colorscale, label-mapped colors, default
+    line width, scatter marker size and outline, bar value labels, data
+    label fonts, uppercase legend name and the default hover template.
+    """
+    bar_text_font = {**text_font, "weight": "bold"}
+    separator_line = "_" * 30
+
+    for trace in fig.data:
+        trace_type = trace.type
+        update = {}
+
+        # Continuous palette: colorscale for z-valued traces (choropleth,
+        # heatmap, ...) and for color-mapped markers
+        if colorscale:
+            if _prop(trace, "z") is not None:
+                update["colorscale"] = colorscale
+                # Choropleth from px.choropleth often uses layout.coloraxis; clear it so
+                # this trace uses its own colorscale (WB palette).
+                if _prop(trace, "coloraxis"):
+                    update["coloraxis"] = None
+            elif isinstance(_prop(trace, "marker.color"), (list, np.ndarray)):
+                update["marker.colorscale"] = colorscale
+
+        # Label-based colors from the trace name
+        if label_map and trace.name in label_map:
+            color = label_map[trace.name]
+            for prop in ("marker.color", "line.color", "fillcolor"):
+                if prop in trace:
+                    update[prop] = color
+
+        # Default line width; scatter markers get size 8 and a white outline
+        # (bar traces have no marker.size)
+        if "line" in trace and "width" in trace.line and trace.line.width is None:
+            update["line.width"] = 2.0
+        if trace_type in ("scatter", "scattergl"):
+            if trace.marker.size is None:
+                update["marker.size"] = 8
+            update["marker.line"] = dict(color="white", width=1)
+
+        # Bar value labels beside bars (values are in y for vertical, x for horizontal)
+        has_text = _prop(trace, "text") is not None
+        if trace_type == "bar" and bar_labels:
+            vals = trace.y if trace.orientation != "h" else trace.x
+            if vals is not None:
+                update["text"] = bar_value_labels(vals)
+                update["textposition"] = "outside"
+                has_text = True
+
+        # Data labels use the theme font; bar value labels are bold
+        if has_text or _prop(trace, "texttemplate") is not None:
+            font = bar_text_font if trace_type == "bar" else text_font
+            for prop in ("insidetextfont", "outsidetextfont", "textfont"):
+                if _is_empty(trace, prop):
+                    update[prop] = dict(font)
+
+        # Uppercase legend labels to match Matplotlib
+        if summary.has_legend and trace.name:
+            update["name"] = trace.name.upper()
+
+        # Hover per World Bank style guide when not set by the user
+        x, y = _prop(trace, "x"), _prop(trace, "y")
+        if "hovertemplate" in trace and trace.hovertemplate is None and x is not None and y is not None:
+            update["hovertemplate"] = (
+                f"{x_title}: <b>{_hover_field('x', x)}</b><br>"
+                f"{separator_line}<br>"
+                f"{y_title}: <b>{_hover_field('y', y)}</b>"
+                "<extra></extra>"
+            )
+
+        if update:
+            trace.update(update)
+
+
+def bar_category_ticks(summary, tickfont):
+    """
+    Uppercase category tick labels for the first bar trace, as an axis
+    layout dict, or ``None`` when there is no bar trace with categories.
+    """
+    bar_trace = summary.first_bar
+    if bar_trace is None:
+        return None
+    cat_vals = bar_trace.y if summary.is_bar_horizontal else bar_trace.x
+    if cat_vals is None:
+        return None
+    if isinstance(cat_vals, str) or not hasattr(cat_vals, "__iter__"):
+        cat_vals = [cat_vals]
+    categories = np.asarray(cat_vals)
+    if categories.ndim == 1 and categories.dtype.kind in "iuf":
+        ticktext = categories.astype(str)
+    elif categories.ndim == 1 and categories.dtype.kind == "U":
+        ticktext = np.char.upper(categories)
+    else:
+        categories = list(cat_vals)
+        ticktext = [str(c).upper() for c in categories]
+    return dict(tickvals=categories, ticktext=ticktext, tickfont=tickfont)
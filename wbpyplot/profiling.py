@@ -0,0 +1,156 @@
+# profiling.py
+import time
+
+_render_hook = None
+
+
+class RenderReport:
+    """
+    Timing and draw-count report for a single ``wb_plot`` render.
+
+    Attributes
+    ----------
+    backend : {"mpl", "plotly"}
+        Backend that produced the figure.
+    stages : dict[str, float]
+        Wall time in seconds per render stage, in the order the stages first
+        ran. Stages that run more than once (e.g. ``tight_layout``) are summed.
+    draw_count : int
+        Number of explicit ``fig.canvas.draw()`` calls made during the render
+        (Matplotlib only; the final ``savefig`` rasterization is timed in the
+        ``savefig`` stage but not counted here).
+    artist_counts : dict[str, int]
+        Artists on the finished figure (Matplotlib) or traces and data
+        points (Plotly).
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.stages = {}
+        self.draw_count = 0
+        self.artist_counts = {}
+        self._last = time.perf_counter()
+        self._canvas = None
+
+    def mark(self, stage):
+        """Attribute the time since the previous mark to ``stage``."""
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + (now - self._last)
+        self._last = now
+
+    def watch_canvas(self, fig):
+        """Count ``fig.canvas.draw()`` calls until :meth:`finish` is called."""
+        canvas = fig.canvas
+        draw = canvas.draw
+
+        def counting_draw(*args, **kwargs):
+            self.draw_count += 1
+            return draw(*args, **kwargs)
+
+        canvas.draw = counting_draw
+        self._canvas = canvas
+
+    def unwatch_canvas(self):
+        """Stop counting draws and restore the canvas' own ``draw``."""
+        if self._canvas is not None:
+            # Drop the instance attribute so the class method is used again
+            self._canvas.__dict__.pop("draw", None)
+            self._canvas = None
+
+    def finish(self, fig):
+        """Stop counting draws and record artist counts for ``fig``."""
+        self.unwatch_canvas()
+        if fig is None:
+            return
+        if self.backend == "mpl":
+            axes = fig.get_axes()
+            self.artist_counts = {
+                "axes": len(axes),
+                "lines": sum(len(ax.lines) for ax in axes),
+                "collections": sum(len(ax.collections) for ax in axes),
+                "patches": sum(len(ax.patches) for ax in axes),
+                "images": sum(len(ax.images) for ax in axes),
+                "texts": len(fig.texts) + sum(len(ax.texts) for ax in axes),
+                "total": len(fig.findobj()),
+            }
+        else:
+            self.artist_counts = {
+                "traces": len(fig.data),
+                "points": sum(_trace_length(t) for t in fig.data),
+            }
+
+    @property
+    def total(self):
+        """Total wall time in seconds across all stages."""
+        return sum(self.stages.values())
+
+    def as_dict(self):
+        return {
+            "backend": self.backend,
+            "total": self.total,
+            "stages": dict(self.stages),
+            "draw_count": self.draw_count,
+            "artist_counts": dict(self.artist_counts),
+        }
+
+    def __repr__(self):
+        lines = [f"RenderReport(backend={self.backend!r}, total={self.total * 1000:.1f} ms, draws={self.draw_count})"]
+        for stage, seconds in self.stages.items():
+            lines.append(f"  {stage:<18} {seconds * 1000:8.1f} ms")
+        if self.artist_counts:
+            counts = ", ".join(f"{k}={v}" for k, v in self.artist_counts.items())
+            lines.append(f"  artists: {counts}")
+        return "\n".join(lines)
+
+
+class _NullReport:
+    # Stand-in used when profiling is off so render code can call mark()
+    # unconditionally at negligible cost.
+    def mark(self, stage):
+        pass
+
+    def watch_canvas(self, fig):
+        pass
+
+    def unwatch_canvas(self):
+        pass
+
+    def finish(self, fig):
+        pass
+
+
+_NULL_REPORT = _NullReport()
+
+
+def _trace_length(trace):
+    for attr in ("x", "y", "z", "locations"):
+        vals = getattr(trace, attr, None)
+        if vals is not None and hasattr(vals, "__len__") and not isinstance(vals, str):
+            return len(vals)
+    return 0
+
+
+def set_render_hook(hook):
+    """
+    Register a callable that receives a :class:`RenderReport` after every
+    ``wb_plot`` render, or pass ``None`` to remove it.
+
+    While a hook is set, every render is profiled, whether or not it was
+    decorated with ``profile=True``.
+    """
+    global _render_hook
+    _render_hook = hook
+
+
+def start_report(backend, profile):
+    if profile or _render_hook is not None:
+        return RenderReport(backend)
+    return _NULL_REPORT
+
+
+def finish_report(report):
+    if report is _NULL_REPORT:
+        return None
+    if _render_hook is not None:
+        _render_hook(report)
+    return report
@@ -1,9 +1,18 @@
 import os
+import threading
+from contextlib import contextmanager
+import matplotlib
 from matplotlib import font_manager
-import matplotlib.pyplot as plt
+from cycler import cycler
 
 PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Text measured by warm_font_cache: digits and letters in every weight the
+# charts use
+_WARM_TEXT = "0123456789 ABCDEFGHIJKLMNOPQRSTUVWXYZ abcdefghijklmnopqrstuvwxyz .,%$()-"
+_WARM_WEIGHTS = ("normal", "semibold", "bold")
+
+
 def set_font_family(file):
     font_file = os.path.join(PACKAGE_DIR, "fonts", file)
     if not os.path.isfile(font_file):
@@ -13,6 +22,49 @@ def set_font_family(file):
     return font_prop.get_name()
 
 
+def get_font_list_path():
+    """Path of Matplotlib's font list cache in its cache directory."""
+    return os.path.join(matplotlib.get_cachedir(), f"fontlist-v{font_manager.FontManager.__version__}.json")
+
+
+def warm_font_cache():
+    """
+    Load what the first render in a process would otherwise pay for.
+
+    That is mostly importing Matplotlib's figure, axes and Agg modules, plus
+    building Matplotlib's font list (read from its cache directory when
+    present), opening the bundled font and measuring text in the World
+    Bank font sizes and weights, which fills the font lookup, glyph and
+    text-extent caches. Call it when a service starts (``render_many``
+    workers do) so its first chart renders about as fast as later ones;
+    run ``wbpyplot warm-cache`` at image build time so the font list is
+    persisted too.
+
+    Returns the path of Matplotlib's font list cache, or ``None`` if it
+    could not be written.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from .layout import get_text_renderer, measure_text
+
+    with wb_theme():
+        fig = Figure(dpi=120)
+        FigureCanvasAgg(fig)
+        renderer = get_text_renderer(fig)
+        # Font sizes from get_dynamic_sizes, scaled down for small and
+        # portrait figures
+        for size in range(8, 18):
+            for weight in _WARM_WEIGHTS:
+                measure_text(fig.text(0, 0, _WARM_TEXT, fontsize=size, fontweight=weight), renderer)
+        # One draw loads the glyphs and everything axes need to render
+        fig.subplots().plot([0, 1], [0, 1])
+        fig.canvas.draw()
+        fig.clear()
+    path = get_font_list_path()
+    return path if os.path.isfile(path) else None
+
+
 wb_rcparams = {
     "font.family": set_font_family("OpenSans.ttf"),
     "axes.titleweight": "bold",
@@ -28,7 +80,7 @@ wb_rcparams = {
     "axes.facecolor": "white",
     "lines.linewidth": 2.0,
     "lines.markersize": 6,
-    "axes.prop_cycle": plt.cycler(
+    "axes.prop_cycle": cycler(
         color=[
             "#34A7F2",
             "#FF9800",
@@ -44,6 +96,61 @@ wb_rcparams = {
 }
 
 
+_compiled_theme = None
+# rcParams are process-global and Matplotlib reads them throughout a render
+# (ticks and grid lines are created lazily at draw and save time), so the
+# theme cannot be swapped in only briefly. Matplotlib renders are therefore
+# serialized: a thread holds the lock for its whole render, including the
+# plot function, savefig and show. Parallel rendering uses processes
+# (render_many).
+_theme_lock = threading.RLock()
+
+# Raw rcParams access that skips validation. RcParams._get/_set are private
+# but covered by Matplotlib's deprecation policy (3.7+); older versions only
+# offer plain dict access.
+_rc_get = getattr(matplotlib.RcParams, "_get", dict.__getitem__)
+_rc_set = getattr(matplotlib.RcParams, "_set", dict.__setitem__)
+
+
+def compile_theme():
+    """
+    Return ``wb_rcparams`` validated once by Matplotlib's rcParams validators.
+
+    The result is cached, so later renders apply already-validated values
+    without running the validators again.
+    """
+    global _compiled_theme
+    if _compiled_theme is None:
+        _compiled_theme = {key: matplotlib.RcParams(wb_rcparams)[key] for key in wb_rcparams}
+    return _compiled_theme
+
+
+@contextmanager
+def wb_theme():
+    """
+    Apply the World Bank theme to ``matplotlib.rcParams`` only for the
+    duration of the block, then restore the previous values.
+
+    Figures, axes and artists capture the theme when they are created, so a
+    figure built inside the block keeps its styling after the block ends.
+
+    Blocks are serialized across threads: a second thread entering the
+    block waits until the first has left it, so concurrent ``wb_plot``
+    renders run one at a time rather than in parallel.
+    """
+    compiled = compile_theme()
+    rc = matplotlib.rcParams
+    with _theme_lock:
+        saved = {key: _rc_get(rc, key) for key in compiled}
+        for key, value in compiled.items():
+            _rc_set(rc, key, value)
+        try:
+            yield
+        finally:
+            for key, value in saved.items():
+                _rc_set(rc, key, value)
+
+
 def get_dynamic_sizes(width):
     # Sizes tuned so text doesn't dominate the plot area when embedded (e.g. Quarto)
     if width < 400:
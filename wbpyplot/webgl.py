@@ -0,0 +1,53 @@
+# webgl.py
+
+# Scatter traces with at least this many points are drawn with WebGL
+WEBGL_THRESHOLD = 50_000
+
+
+def _point_count(trace):
+    for attr in ("x", "y"):
+        vals = trace[attr]
+        if vals is not None and not isinstance(vals, str):
+            return len(vals)
+    return 0
+
+
+def _can_use_webgl(trace):
+    # Stacked areas and spline lines have no WebGL equivalent
+    if trace.stackgroup is not None:
+        return False
+    return trace.line.shape in (None, "linear", "hv", "vh", "hvh", "vhv")
+
+
+def use_webgl(fig, threshold):
+    """
+    Convert ``scatter`` traces of ``threshold`` points or more to ``scattergl``.
+
+    SVG scatter traces become unresponsive beyond a few tens of thousands
+    of points; ``scattergl`` draws them with WebGL. Trace order and all
+    attributes that ``scattergl`` supports are kept. Stacked-area and
+    spline traces stay SVG.
+
+    Returns
+    -------
+    int
+        Number of traces that were converted.
+    """
+    import plotly.graph_objects as go
+
+    if threshold is None:
+        return 0
+    traces = []
+    converted = 0
+    for trace in fig.data:
+        if trace.type == "scatter" and _point_count(trace) >= threshold and _can_use_webgl(trace):
+            props = trace.to_plotly_json()
+            props.pop("type", None)
+            trace = go.Scattergl(props, skip_invalid=True)
+            converted += 1
+        traces.append(trace)
+    if converted:
+        # fig.data only accepts its own traces, so rebuild it
+        fig.data = ()
+        fig.add_traces(traces)
+    return converted